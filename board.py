@@ -1,7 +1,28 @@
+import functools
 import pygame
 from typing import Optional, List, Tuple
 from piece import *
 
+@functools.lru_cache(maxsize=32)
+def render_fallback_symbol(symbol: str, color: Tuple[int, int, int]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Piece symbol for sprite-less pieces and its offset from the piece corner, rendered once per (symbol, color)"""
+    text = pygame.font.Font(None, 32).render(symbol, True, color)
+    # Centered on the disc drawn by render_fallback_token
+    return text, text.get_rect(center=(30, 32)).topleft
+
+@functools.lru_cache(maxsize=4)
+def render_fallback_token(base_color: Tuple[int, int, int], shadow_color: Tuple[int, int, int],
+                          border_color: Tuple[int, int, int]) -> pygame.Surface:
+    """Disc behind a sprite-less piece's symbol, on a transparent surface placed at the piece's corner"""
+    token = pygame.Surface((60, 62), pygame.SRCALPHA)
+    # Draw piece shadow
+    pygame.draw.circle(token, shadow_color, (32, 34), 26)
+    # Draw main piece
+    pygame.draw.circle(token, base_color, (30, 32), 25)
+    # Draw border to make pieces more distinct
+    pygame.draw.circle(token, border_color, (30, 32), 25, 3)
+    return token
+
 class Board:
     def __init__(self, cell_size=90, board_offset_x=250, board_offset_y=150):
         self.grid = [[None for _ in range(8)] for _ in range(8)]
@@ -10,6 +31,17 @@ class Board:
         self.board_offset_x = board_offset_x
         self.board_offset_y = board_offset_y
         self.border_width = 20
+        # Screen rect of every cell and of the whole board, fixed for the board's lifetime
+        self.cell_rects = [[pygame.Rect(board_offset_x + col * cell_size, board_offset_y + row * cell_size, cell_size, cell_size)
+                            for col in range(8)] for row in range(8)]
+        self.board_rect = pygame.Rect(board_offset_x, board_offset_y, 8 * cell_size, 8 * cell_size)
+        # Screen x of each column and y of each row
+        self.col_x = tuple(board_offset_x + col * cell_size for col in range(8))
+        self.row_y = tuple(board_offset_y + row * cell_size for row in range(8))
+        self.kings = {}  # Color -> King, so king checks don't scan the grid
+        self.scaled_sprites = {}  # Source sprite -> copy scaled to the piece size
+        self.board_layers = {}  # (palette, font path) -> rendered board, see draw()
+        self.hp_bars = {}  # (bar width, health width) -> HP bar surface
         self.setup_initial_pieces()
         
     def setup_initial_pieces(self):
@@ -40,6 +72,11 @@ class Board:
         # Black pawns
         for col in range(8):
             self.grid[1][col] = Pawn(Color.BLACK, 1, col)
+        self.track_kings()
+
+    def track_kings(self):
+        """Remember each side's king; call after (re)building the grid"""
+        self.kings = {piece.color: piece for piece in self.get_all_pieces() if piece.piece_type == PieceType.KING}
     
     def load_board_sprite(self, sprite_path: str):
         self.board_sprite = pygame.image.load(sprite_path)
@@ -80,15 +117,18 @@ class Board:
         return pieces
     
     def get_king(self, color: Color) -> Optional[Piece]:
-        for piece in self.get_all_pieces(color):
-            if piece.piece_type == PieceType.KING:
-                return piece
-        return None
+        return self.kings.get(color)
     
     def is_king_alive(self, color: Color) -> bool:
         king = self.get_king(color)
         return king is not None and king.is_alive()
     
+    def get_cell_at(self, mouse_x: int, mouse_y: int) -> Optional[Tuple[int, int]]:
+        """(row, col) under the mouse, or None when the point is off the board"""
+        if not self.board_rect.collidepoint(mouse_x, mouse_y):
+            return None
+        return (mouse_y - self.board_offset_y) // self.cell_size, (mouse_x - self.board_offset_x) // self.cell_size
+
     def get_cell_from_mouse(self, mouse_x: int, mouse_y: int) -> Tuple[int, int]:
         col = (mouse_x - self.board_offset_x) // self.cell_size
         row = (mouse_y - self.board_offset_y) // self.cell_size
@@ -100,6 +140,19 @@ class Board:
         return x, y
     
     def draw(self, screen: pygame.Surface, palette=None, pixel_font_path=None):
+        # The board never changes, so its squares and labels are rendered once per palette/font
+        key = (tuple(palette.items()) if palette else None, pixel_font_path)
+        layers = self.board_layers.get(key)
+        if layers is None:
+            layers = self.render_board_layers(palette, pixel_font_path)
+            self.board_layers[key] = layers
+        squares, squares_pos, label_blits = layers
+        screen.blit(squares, squares_pos)
+        screen.blits(label_blits, doreturn=False)
+
+    def render_board_layers(self, palette=None, pixel_font_path=None):
+        """Render the bordered squares as one surface plus the coordinate labels as
+        (surface, position) blits; the labels overhang the border, so they stay separate"""
         # Use retro palette if provided
         if palette is None:
             palette = {
@@ -121,8 +174,10 @@ class Board:
             8 * self.cell_size + 2 * self.border_width,
             8 * self.cell_size + 2 * self.border_width
         )
-        pygame.draw.rect(screen, palette["border"], border_rect, 0)
-        pygame.draw.rect(screen, palette["neon_cyan"], border_rect, 4)
+        squares = pygame.Surface(border_rect.size)
+        origin_x, origin_y = border_rect.topleft
+        pygame.draw.rect(squares, palette["border"], squares.get_rect(), 0)
+        pygame.draw.rect(squares, palette["neon_cyan"], squares.get_rect(), 4)
 
         # Draw chess squares with solid retro colors
         light_color = (40, 40, 60)
@@ -130,28 +185,33 @@ class Board:
         for row in range(8):
             for col in range(8):
                 color = light_color if (row + col) % 2 == 0 else dark_color
-                x = self.board_offset_x + col * self.cell_size
-                y = self.board_offset_y + row * self.cell_size
-                pygame.draw.rect(screen, color, (x, y, self.cell_size, self.cell_size))
+                cell_rect = self.cell_rects[row][col].move(-origin_x, -origin_y)
+                squares.fill(color, cell_rect)
                 # Draw chunky pixel outline for each cell
-                pygame.draw.rect(screen, palette["border"], (x, y, self.cell_size, self.cell_size), 3)
+                pygame.draw.rect(squares, palette["border"], cell_rect, 3)
 
         # Draw coordinate labels in pixel font
         font = pygame.font.Font(pixel_font_path or "Hackathon_image/pixel_font.ttf", 18)
+        label_blits = []
         for col in range(8):
             letter = chr(ord('a') + col)
             text = font.render(letter, True, palette["neon_green"])
             x = self.board_offset_x + col * self.cell_size + self.cell_size // 2 - 8
             y = self.board_offset_y + 8 * self.cell_size + 5
-            screen.blit(text, (x, y))
+            label_blits.append((text, (x, y)))
         for row in range(8):
             number = str(8 - row)
             text = font.render(number, True, palette["neon_green"])
             x = self.board_offset_x - 22
             y = self.board_offset_y + row * self.cell_size + self.cell_size // 2 - 10
-            screen.blit(text, (x, y))
+            label_blits.append((text, (x, y)))
+        return squares, border_rect.topleft, label_blits
     
     def draw_pieces(self, screen: pygame.Surface):
+        # Sprites stay inside their cells and the HP bars sit in the gap between
+        # rows, so neither overlaps the other and each goes out in one blits call
+        sprite_blits = []
+        bar_blits = []
         for row in range(8):
             for col in range(8):
                 piece = self.grid[row][col]
@@ -160,9 +220,15 @@ class Board:
                     y = self.board_offset_y + row * self.cell_size + 8
                     
                     if piece.sprite:
-                        # Scale sprite to fit cell with better proportions
-                        scaled_sprite = pygame.transform.scale(piece.sprite, (self.cell_size - 16, self.cell_size - 16))
-                        screen.blit(scaled_sprite, (x, y))
+                        # Scale sprite to fit cell with better proportions; sprites are shared per type, so scale each once
+                        scaled_sprite = self.scaled_sprites.get(piece.sprite)
+                        if scaled_sprite is None:
+                            scaled_sprite = pygame.transform.scale(piece.sprite, (self.cell_size - 16, self.cell_size - 16))
+                            # Match the display format once so the per-frame blit needs no conversion
+                            if pygame.display.get_surface():
+                                scaled_sprite = scaled_sprite.convert_alpha() if scaled_sprite.get_flags() & pygame.SRCALPHA else scaled_sprite.convert()
+                            self.scaled_sprites[piece.sprite] = scaled_sprite
+                        sprite_blits.append((scaled_sprite, (x, y)))
                     else:
                         # Enhanced fallback with better color distinction
                         if piece.color == Color.WHITE:
@@ -176,61 +242,63 @@ class Board:
                             border_color = (120, 80, 80)
                             text_color = (255, 200, 200)    # Light red text
                         
-                        # Draw piece shadow
-                        pygame.draw.circle(screen, shadow_color, (x + 32, y + 34), 26)
-                        # Draw main piece
-                        pygame.draw.circle(screen, base_color, (x + 30, y + 32), 25)
-                        # Draw border to make pieces more distinct
-                        pygame.draw.circle(screen, border_color, (x + 30, y + 32), 25, 3)
+                        # Shadowed, bordered disc, drawn once per color
+                        sprite_blits.append((render_fallback_token(base_color, shadow_color, border_color), (x, y)))
                         
                         # Draw piece symbol with better distinction
-                        font = pygame.font.Font(None, 32)
-                        symbols = {
-                            PieceType.KING: '♔',
-                            PieceType.QUEEN: '♕', 
-                            PieceType.ROOK: '♖',
-                            PieceType.BISHOP: '♗',
-                            PieceType.KNIGHT: '♘',
-                            PieceType.PAWN: '♙'
-                        }
-                        symbol = symbols.get(piece.piece_type, '?')
-                        text = font.render(symbol, True, text_color)
-                        text_rect = text.get_rect(center=(x + 30, y + 32))
-                        screen.blit(text, text_rect)
+                        symbol = PIECE_SYMBOLS.get(piece.piece_type, '?')
+                        text, (text_dx, text_dy) = render_fallback_symbol(symbol, text_color)
+                        sprite_blits.append((text, (x + text_dx, y + text_dy)))
                     
                     # Draw HP bar above piece
                     if piece.hp < piece.max_hp:
                         bar_width = self.cell_size - 20
-                        bar_height = 6
-                        bar_x = x + 10
-                        bar_y = y - 10
-                        
-                        # Background bar (red)
-                        pygame.draw.rect(screen, (200, 50, 50), (bar_x, bar_y, bar_width, bar_height))
-                        
-                        # Health bar (green)
                         health_ratio = piece.hp / piece.max_hp
                         health_width = int(bar_width * health_ratio)
-                        pygame.draw.rect(screen, (50, 200, 50), (bar_x, bar_y, health_width, bar_height))
-                        
-                        # Bar border
-                        pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 1)
+                        bar_blits.append((self.get_hp_bar(bar_width, health_width), (x + 10, y - 10)))
+        screen.blits(sprite_blits, doreturn=False)
+        screen.blits(bar_blits, doreturn=False)
+
+    def get_hp_bar(self, bar_width: int, health_width: int) -> pygame.Surface:
+        """Red track, green fill and white border for one fill width, built once"""
+        key = (bar_width, health_width)
+        bar = self.hp_bars.get(key)
+        if bar is None:
+            bar_height = 6
+            bar = pygame.Surface((bar_width, bar_height))
+            # Background bar (red)
+            bar.fill((200, 50, 50))
+            # Health bar (green)
+            bar.fill((50, 200, 50), (0, 0, health_width, bar_height))
+            # Bar border
+            pygame.draw.rect(bar, (255, 255, 255), (0, 0, bar_width, bar_height), 1)
+            self.hp_bars[key] = bar
+        return bar
     
-    def highlight_cell(self, screen: pygame.Surface, row: int, col: int, color: Tuple[int, int, int]):
+    def highlight_cell(self, screen: pygame.Surface, row: int, col: int, color: Tuple[int, int, int],
+                       origin: Tuple[int, int] = (0, 0)):
         # Draw chunky neon pixel outline for retro highlight
+        # origin is the screen position of the target surface's top-left corner
         if self.is_valid_position(row, col):
-            x = self.board_offset_x + col * self.cell_size
-            y = self.board_offset_y + row * self.cell_size
+            cell_rect = self.cell_rects[row][col].move(-origin[0], -origin[1])
+            x, y = cell_rect.topleft
             outline_color = color
             # Draw 3-pixel thick neon border
-            pygame.draw.rect(screen, outline_color, (x, y, self.cell_size, self.cell_size), 3)
+            pygame.draw.rect(screen, outline_color, cell_rect, 3)
             # Draw pixel corners for extra retro effect
             pixel_size = 7
-            pygame.draw.rect(screen, outline_color, (x, y, pixel_size, pixel_size))
-            pygame.draw.rect(screen, outline_color, (x + self.cell_size - pixel_size, y, pixel_size, pixel_size))
-            pygame.draw.rect(screen, outline_color, (x, y + self.cell_size - pixel_size, pixel_size, pixel_size))
-            pygame.draw.rect(screen, outline_color, (x + self.cell_size - pixel_size, y + self.cell_size - pixel_size, pixel_size, pixel_size))
+            screen.fill(outline_color, (x, y, pixel_size, pixel_size))
+            screen.fill(outline_color, (x + self.cell_size - pixel_size, y, pixel_size, pixel_size))
+            screen.fill(outline_color, (x, y + self.cell_size - pixel_size, pixel_size, pixel_size))
+            screen.fill(outline_color, (x + self.cell_size - pixel_size, y + self.cell_size - pixel_size, pixel_size, pixel_size))
     
     def highlight_moves(self, screen: pygame.Surface, moves: List[Tuple[int, int]]):
         for row, col in moves:
             self.highlight_cell(screen, row, col, (0, 255, 0))
+
+    def render_highlights(self, cells: List[Tuple[int, int, Tuple[int, int, int]]]) -> pygame.Surface:
+        """Draw every (row, col, color) highlight into one transparent board-sized overlay"""
+        overlay = pygame.Surface(self.board_rect.size, pygame.SRCALPHA)
+        for row, col, color in cells:
+            self.highlight_cell(overlay, row, col, color, self.board_rect.topleft)
+        return overlay
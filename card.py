@@ -17,6 +17,7 @@ class Card:
         self.icon_path = icon_path
         self.name = name
         self.cost = cost
+        self.kind = "card"
 
     def get_effect_description(self):
         if self.card_type == CardType.ARROW_VOLLEY:
@@ -49,7 +50,7 @@ class Card:
                     piece = game.board.grid[row][col]
                     if piece and piece.is_alive() and piece.color != player:
                         piece.hp = max(0, piece.hp - 1)
-            game.add_to_log(f"{player.value.title()} used Arrow Volley! Enemy units take 1 damage.")
+            game.add_to_log(f"{COLOR_NAMES[player]} used Arrow Volley! Enemy units take 1 damage.")
         # Disarm is stored, effect applied later via inventory UI
         # Add more card effects here as needed
         elif self.card_type == CardType.REDEMPTION:
@@ -62,7 +63,7 @@ class Card:
                     else:
                         if piece and piece.is_alive():
                             piece.hp = min(piece.max_hp, piece.hp+1)
-            game.add_to_log(f"{player.value.title()} used Redemption! Black tiles take 1 dmg; white tiles gain 1 health.")
+            game.add_to_log(f"{COLOR_NAMES[player]} used Redemption! Black tiles take 1 dmg; white tiles gain 1 health.")
 
         elif self.card_type == CardType.LIGHTNING:
             numbers = random.sample(range(64), 5)
@@ -72,13 +73,9 @@ class Card:
                 piece = game.board.grid[row][col]
                 if piece and piece.is_alive():
                     piece.hp = max(0, piece.hp-3)
-            game.add_to_log(f"{player.value.title()} used Lightning! Five random tiles take 3 dmg.")
+            game.add_to_log(f"{COLOR_NAMES[player]} used Lightning! Five random tiles take 3 dmg.")
         elif self.card_type == CardType.TOWER:
-            if player == Color.WHITE:
-                game.white_reserve.append(Tower(player, 0, 0))
-                game.white_reserve.append(Tower(player, 0, 0))
-            elif player == Color.BLACK:
-                game.black_reserve.append(Tower(player, 0, 0))
-                game.black_reserve.append(Tower(player, 0, 0))
-            game.add_to_log(f"{player.value.title()} used Tower Defense! Gain 2 rooks that cannot move.")
+            game.add_to_reserve(player, Tower(player, 0, 0))
+            game.add_to_reserve(player, Tower(player, 0, 0))
+            game.add_to_log(f"{COLOR_NAMES[player]} used Tower Defense! Gain 2 rooks that cannot move.")
         self.cleanup(game, player)
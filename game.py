@@ -3,6 +3,7 @@ from typing import Optional, List, Tuple
 from board import Board
 from piece import Piece, Color, PieceType
 from enum import Enum
+from collections import deque
 
 class GameState(Enum):
     PLAYING = "playing"
@@ -21,8 +22,10 @@ class Game:
         self.attack_targets = []
         self.game_state = GameState.PLAYING
         self.action_mode = "move"  # "move" or "attack"
-        self.game_log = []
+        self.game_log = deque(maxlen=8)  # Keep only last 8 messages
         self.font = None
+        self.text_cache = {}  # (font id, text, color) -> rendered surface
+        self.background = None  # See get_background()
         self.load_assets()
         
     def load_assets(self):
@@ -51,6 +54,9 @@ class Game:
             try:
                 sprite_path = f"Hackathon_image/{filename}"
                 sprite = pygame.image.load(sprite_path)
+                # Match the display's pixel format once instead of on every blit
+                if pygame.display.get_surface():
+                    sprite = sprite.convert_alpha() if sprite.get_flags() & pygame.SRCALPHA else sprite.convert()
                 
                 # Apply sprite to all pieces of this type
                 for piece in self.board.get_all_pieces():
@@ -177,10 +183,24 @@ class Game:
             self.game_state = GameState.WHITE_WINS
             self.add_to_log("WHITE WINS! Black King defeated!")
     
+    def render_cached(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """font.render(text, True, color), memoized; oldest entries are evicted past 256"""
+        return self.render_cached_sized(font, text, color)[0]
+
+    def render_cached_sized(self, font: pygame.font.Font, text: str, color) -> Tuple[pygame.Surface, int, int]:
+        """Like render_cached, but returns (surface, width, height) for centering"""
+        key = (id(font), text, color)
+        entry = self.text_cache.get(key)
+        if entry is None:
+            surface = font.render(text, True, color)
+            entry = (surface, surface.get_width(), surface.get_height())
+            if len(self.text_cache) >= 256:
+                del self.text_cache[next(iter(self.text_cache))]
+            self.text_cache[key] = entry
+        return entry
+
     def add_to_log(self, message: str):
         self.game_log.append(message)
-        if len(self.game_log) > 8:  # Keep only last 8 messages
-            self.game_log.pop(0)
     
     def draw_ui(self, screen: pygame.Surface):
         # Draw elegant title with shadow
@@ -188,10 +208,11 @@ class Game:
         title_color = (255, 215, 100)  # Gold
         title_text = "♔ RETRO PIXEL CHESS BATTLE ♔"
         
-        title_shadow = self.title_font.render(title_text, True, shadow_color)
-        title_main = self.title_font.render(title_text, True, title_color)
+        title_shadow = self.render_cached(self.title_font, title_text, shadow_color)
+        title_main, title_width, _ = self.render_cached_sized(self.title_font, title_text, title_color)
         
-        title_x = screen.get_width() // 2 - title_main.get_width() // 2
+        center_x = screen.get_width() // 2
+        title_x = center_x - title_width // 2
         screen.blit(title_shadow, (title_x + 2, 22))
         screen.blit(title_main, (title_x, 20))
         
@@ -199,17 +220,14 @@ class Game:
         if self.game_state == GameState.PLAYING:
             turn_color = (255, 255, 100) if self.current_player == Color.WHITE else (150, 150, 255)
             turn_text = f"⚔ {self.current_player.value.upper()}'S TURN ⚔"
-            turn_surface = self.font.render(turn_text, True, turn_color)
-            turn_x = screen.get_width() // 2 - turn_surface.get_width() // 2
-            screen.blit(turn_surface, (turn_x, 75))
+            turn_surface, turn_width, _ = self.render_cached_sized(self.font, turn_text, turn_color)
+            screen.blit(turn_surface, (center_x - turn_width // 2, 75))
         elif self.game_state == GameState.WHITE_WINS:
-            win_text = self.title_font.render("⚔ WHITE VICTORY! ⚔", True, (255, 215, 100))
-            win_x = screen.get_width() // 2 - win_text.get_width() // 2
-            screen.blit(win_text, (win_x, 75))
+            win_text, win_width, _ = self.render_cached_sized(self.title_font, "⚔ WHITE VICTORY! ⚔", (255, 215, 100))
+            screen.blit(win_text, (center_x - win_width // 2, 75))
         elif self.game_state == GameState.BLACK_WINS:
-            win_text = self.title_font.render("⚔ BLACK VICTORY! ⚔", True, (255, 215, 100))
-            win_x = screen.get_width() // 2 - win_text.get_width() // 2
-            screen.blit(win_text, (win_x, 75))
+            win_text, win_width, _ = self.render_cached_sized(self.title_font, "⚔ BLACK VICTORY! ⚔", (255, 215, 100))
+            screen.blit(win_text, (center_x - win_width // 2, 75))
         
         # Enhanced stats panel
         if self.selected_piece:
@@ -221,12 +239,12 @@ class Game:
             # Draw stats panel background
             panel_color = (40, 40, 60)
             border_color = (100, 100, 120)
-            pygame.draw.rect(screen, panel_color, (panel_x, panel_y, panel_width, panel_height))
+            screen.fill(panel_color, (panel_x, panel_y, panel_width, panel_height))
             pygame.draw.rect(screen, border_color, (panel_x, panel_y, panel_width, panel_height), 2)
             
             # Panel title
-            title = self.font.render("SELECTED PIECE", True, (255, 215, 100))
-            screen.blit(title, (panel_x + 10, panel_y + 10))
+            title = self.render_cached(self.font, "SELECTED PIECE", (255, 215, 100))
+            panel_blits = [(title, (panel_x + 10, panel_y + 10))]
             
             # Piece info
             piece_name = self.selected_piece.piece_type.value.upper()
@@ -241,14 +259,16 @@ class Game:
             
             for i, line in enumerate(info_lines):
                 color = (255, 255, 255) if i == 0 else (200, 200, 200)
-                text = self.small_font.render(line, True, color)
-                screen.blit(text, (panel_x + 10, panel_y + 35 + i * 18))
+                text = self.render_cached(self.small_font, line, color)
+                panel_blits.append((text, (panel_x + 10, panel_y + 35 + i * 18)))
             
             # Show current action mode
             mode_text = f"Mode: {self.action_mode.upper()}"
             mode_color = (100, 255, 100) if self.action_mode == "move" else (255, 100, 100)
-            mode_surface = self.small_font.render(mode_text, True, mode_color)
-            screen.blit(mode_surface, (panel_x + 10, panel_y + 95))
+            mode_surface = self.render_cached(self.small_font, mode_text, mode_color)
+            panel_blits.append((mode_surface, (panel_x + 10, panel_y + 95)))
+            # Title and rows go out in one batch
+            screen.blits(panel_blits, doreturn=False)
         
         # Enhanced game log - moved higher to not block board
         log_x = 50
@@ -259,27 +279,36 @@ class Game:
         # Log panel background
         log_color = (30, 30, 50)
         log_border = (80, 80, 100)
-        pygame.draw.rect(screen, log_color, (log_x, log_y, log_width, log_height))
+        screen.fill(log_color, (log_x, log_y, log_width, log_height))
         pygame.draw.rect(screen, log_border, (log_x, log_y, log_width, log_height), 2)
         
         # Log title
-        log_title = self.font.render("📜 BATTLE LOG", True, (255, 215, 100))
-        screen.blit(log_title, (log_x + 10, log_y + 10))
+        log_title = self.render_cached(self.font, "📜 BATTLE LOG", (255, 215, 100))
+        log_blits = [(log_title, (log_x + 10, log_y + 10))]
         
         # Log messages - reduced to 4 lines to fit smaller space
-        for i, message in enumerate(self.game_log[-4:]):  # Show last 4 messages
-            log_text = self.small_font.render(message, True, (180, 180, 200))
-            screen.blit(log_text, (log_x + 10, log_y + 35 + i * 18))
+        for i, message in enumerate(list(self.game_log)[-4:]):  # Show last 4 messages
+            log_text = self.render_cached(self.small_font, message, (180, 180, 200))
+            log_blits.append((log_text, (log_x + 10, log_y + 35 + i * 18)))
+        screen.blits(log_blits, doreturn=False)
+    
+    def get_background(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Textured background for the given screen size, rendered once per size"""
+        if self.background is None or self.background.get_size() != size:
+            background = pygame.Surface(size)
+            # Clear screen with gradient-like background
+            background.fill((20, 25, 40))  # Dark blue-grey
+            
+            # Add some texture with subtle rectangles
+            for i in range(0, size[0], 100):
+                for j in range(0, size[1], 100):
+                    if (i + j) % 200 == 0:
+                        background.fill((25, 30, 45), (i, j, 50, 50))
+            self.background = background
+        return self.background
     
     def draw(self, screen: pygame.Surface):
-        # Clear screen with gradient-like background
-        screen.fill((20, 25, 40))  # Dark blue-grey
-        
-        # Add some texture with subtle rectangles
-        for i in range(0, screen.get_width(), 100):
-            for j in range(0, screen.get_height(), 100):
-                if (i + j) % 200 == 0:
-                    pygame.draw.rect(screen, (25, 30, 45), (i, j, 50, 50))
+        screen.blit(self.get_background(screen.get_size()), (0, 0))
         
         # Draw board
         self.board.draw(screen)
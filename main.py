@@ -22,6 +22,11 @@ def main():
     # Add initial message to log
     game.add_to_log("Game started! White moves first.")
     
+    # The instructions panel text never changes, so render it once
+    instructions_x = SCREEN_WIDTH - 300
+    instructions_y = 150
+    instruction_blits = render_instructions(instructions_x, instructions_y)
+    
     # Main game loop
     running = True
     while running:
@@ -48,35 +53,15 @@ def main():
         game.draw(screen)
         
         # Draw instructions panel
-        font = pygame.font.Font(None, 24)
-        instructions_x = SCREEN_WIDTH - 300
-        instructions_y = 150
         panel_width = 280
         panel_height = 200
         
         # Instructions panel background
-        pygame.draw.rect(screen, (40, 40, 60), (instructions_x, instructions_y, panel_width, panel_height))
+        screen.fill((40, 40, 60), (instructions_x, instructions_y, panel_width, panel_height))
         pygame.draw.rect(screen, (100, 100, 120), (instructions_x, instructions_y, panel_width, panel_height), 2)
         
-        # Panel title
-        title = font.render("🎮 CONTROLS", True, (255, 215, 100))
-        screen.blit(title, (instructions_x + 10, instructions_y + 10))
-        
-        instructions = [
-            "🖱️ Click to select pieces",
-            "⚪ White pieces = Your army", 
-            "🔴 Red pieces = Enemy army",
-            "🟡 Yellow = selected piece",
-            "🟢 Green = move targets",
-            "🔴 Red = attack targets",
-            "⌨️ SPACE = toggle mode",
-            "🔄 R = reset, 🚪 ESC = quit"
-        ]
-        
-        small_font = pygame.font.Font(None, 18)
-        for i, instruction in enumerate(instructions):
-            text = small_font.render(instruction, True, (200, 200, 200))
-            screen.blit(text, (instructions_x + 10, instructions_y + 40 + i * 25))
+        # Panel title and instructions
+        screen.blits(instruction_blits, doreturn=False)
         
         # Update the display
         pygame.display.flip()
@@ -88,5 +73,28 @@ def main():
     pygame.quit()
     sys.exit()
 
+def render_instructions(instructions_x: int, instructions_y: int):
+    """Render the controls panel title and lines once, as (surface, position) blits"""
+    font = pygame.font.Font(None, 24)
+    title = font.render("🎮 CONTROLS", True, (255, 215, 100))
+    blits = [(title, (instructions_x + 10, instructions_y + 10))]
+    
+    instructions = [
+        "🖱️ Click to select pieces",
+        "⚪ White pieces = Your army", 
+        "🔴 Red pieces = Enemy army",
+        "🟡 Yellow = selected piece",
+        "🟢 Green = move targets",
+        "🔴 Red = attack targets",
+        "⌨️ SPACE = toggle mode",
+        "🔄 R = reset, 🚪 ESC = quit"
+    ]
+    
+    small_font = pygame.font.Font(None, 18)
+    for i, instruction in enumerate(instructions):
+        text = small_font.render(instruction, True, (200, 200, 200))
+        blits.append((text, (instructions_x + 10, instructions_y + 40 + i * 25)))
+    return blits
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import functools
 import pygame
 import sys
 from piece import Color
@@ -29,6 +30,13 @@ def main():
     # Add initial message to log
     game.add_to_log("TFT Chess Battle started! Buy pieces and prepare for war!")
     game.add_to_log("Shop is open - click items to buy with coins")
+
+    # CRT scanline overlay, loaded once and rescaled only when the window size changes
+    try:
+        crt_source = pygame.image.load("Hackathon_image/crt_scanlines.png").convert_alpha()
+    except Exception:
+        crt_source = None
+    crt_overlay = None
     
     # Main game loop
     running = True
@@ -94,21 +102,21 @@ def main():
                     running = False
 
         
-        # Draw everything
+        # Advance timed game logic (combat resolution), then draw everything
+        game.update()
         game.draw(screen)
         
         # Draw controls based on current phase
         draw_phase_controls(screen, game)
         
         # Overlay CRT scanline effect
-        try:
-            crt_overlay = pygame.image.load("Hackathon_image/crt_scanlines.png").convert_alpha()
-            crt_overlay = pygame.transform.scale(crt_overlay, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        if crt_source:
+            if crt_overlay is None or crt_overlay.get_size() != (SCREEN_WIDTH, SCREEN_HEIGHT):
+                crt_overlay = pygame.transform.scale(crt_source, (SCREEN_WIDTH, SCREEN_HEIGHT))
             screen.blit(crt_overlay, (0, 0))
-        except Exception:
-            pass
 
-        # Update the display
+        # Update the display. The whole scene is redrawn every frame and the
+        # CRT overlay covers the full screen, so partial updates would not help
         pygame.display.flip()
         
         # Control frame rate
@@ -120,32 +128,40 @@ def main():
 
 def draw_phase_controls(screen: pygame.Surface, game: TFTGame):
     """Draw context-sensitive controls at the very bottom, not blocking UI"""
-    font = pygame.font.Font(None, 20)
-    controls_area = pygame.Rect(0, screen.get_height() - 40, screen.get_width(), 35)
-    pygame.draw.rect(screen, (30, 30, 50), controls_area)
-    pygame.draw.rect(screen, (100, 100, 120), controls_area, 2)
+    # The bar only changes with the phase, shop state or round, so it is rendered
+    # once per combination instead of every frame
+    bar = render_phase_controls(game.phase, game.shop_open, game.round_number, screen.get_width())
+    screen.blit(bar, (0, screen.get_height() - 40))
+
+@functools.lru_cache(maxsize=8)
+def render_phase_controls(phase: GamePhase, shop_open: bool, round_number: int, width: int) -> pygame.Surface:
+    """Render the controls bar for one game state"""
+    bar = pygame.Surface((width, 35))
+    controls_area = bar.get_rect()
+    bar.fill((30, 30, 50), controls_area)
+    pygame.draw.rect(bar, (100, 100, 120), controls_area, 2)
 
     # Controls based on phase
-    if game.phase == GamePhase.SHOP or game.phase == GamePhase.SETUP:
+    if phase == GamePhase.SHOP or phase == GamePhase.SETUP:
         controls = [
-            "🛒 Shop open: Click items to buy with coins" if game.shop_open else "🔒 Shop closed: Prepare for battle",
+            "🛒 Shop open: Click items to buy with coins" if shop_open else "🔒 Shop closed: Prepare for battle",
             "🎯 Click empty board positions to deploy pieces from reserve",
             "🚀 Press B to start battle phase",
             "🔄 R = reset, ESC = quit"
         ]
-    elif game.phase == GamePhase.BATTLE:
+    elif phase == GamePhase.BATTLE:
         controls = [
             "⚔️ Battle Phase: Move and attack enemies",
             "🖱️ Click pieces to select, SPACE = toggle move/attack",
             "🏁 Press E to end battle early",
             "🎯 Kill enemies to earn coins!"
         ]
-    elif game.phase == GamePhase.END_ROUND:
+    elif phase == GamePhase.END_ROUND:
         controls = [
-            f"🏆 Round {game.round_number} Complete!",
+            f"🏆 Round {round_number} Complete!",
             "💰 Both players earned +1 coin",
             "🚀 Press N for next round",
-            f"🛒 Shop {'opens' if (game.round_number + 1) % 3 == 1 else 'stays closed'} next round"
+            f"🛒 Shop {'opens' if (round_number + 1) % 3 == 1 else 'stays closed'} next round"
         ]
     else:
         controls = ["🎮 Use keyboard shortcuts to control the game"]
@@ -154,7 +170,8 @@ def draw_phase_controls(screen: pygame.Surface, game: TFTGame):
     control_font = pygame.font.Font(None, 18)
     all_controls = " | ".join(controls)
     text = control_font.render(all_controls, True, (200, 200, 200))
-    screen.blit(text, (controls_area.x + 10, controls_area.y + 8))
+    bar.blit(text, (controls_area.x + 10, controls_area.y + 8))
+    return bar
 
 if __name__ == "__main__":
     main()
@@ -14,6 +14,37 @@ class Color(Enum):
     WHITE = "white"
     BLACK = "black"
 
+# Display names ("White", "Knight") for log and hover text
+COLOR_NAMES = {color: color.value.title() for color in Color}
+PIECE_NAMES = {piece_type: piece_type.value.title() for piece_type in PieceType}
+# Chess glyphs drawn when a piece has no sprite
+PIECE_SYMBOLS = {
+    PieceType.KING: '♔',
+    PieceType.QUEEN: '♕',
+    PieceType.ROOK: '♖',
+    PieceType.BISHOP: '♗',
+    PieceType.KNIGHT: '♘',
+    PieceType.PAWN: '♙',
+}
+
+# Move geometry precomputed per square, so move generation walks ready-made
+# on-board squares instead of re-deriving and bounds-checking each step
+ROOK_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+BISHOP_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+QUEEN_DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+KING_STEPS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+KNIGHT_JUMPS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+
+def _on_board_offsets(row: int, col: int, offsets) -> Tuple[Tuple[int, int], ...]:
+    return tuple((row + dr, col + dc) for dr, dc in offsets if 0 <= row + dr < 8 and 0 <= col + dc < 8)
+
+# RAYS[direction][row][col]: squares from (row, col) outwards to the board edge
+RAYS = {(dr, dc): [[_on_board_offsets(row, col, [(i * dr, i * dc) for i in range(1, 8)]) for col in range(8)] for row in range(8)]
+        for dr, dc in QUEEN_DIRECTIONS}
+# KING_TARGETS / KNIGHT_TARGETS[row][col]: on-board squares one king step / knight jump away
+KING_TARGETS = [[_on_board_offsets(row, col, KING_STEPS) for col in range(8)] for row in range(8)]
+KNIGHT_TARGETS = [[_on_board_offsets(row, col, KNIGHT_JUMPS) for col in range(8)] for row in range(8)]
+
 class Piece:
     def __init__(self, piece_type: PieceType, color: Color, row: int, col: int, attack = 0, hp = 0, max_hp = 0, cost = float('inf')):
         self.piece_type = piece_type
@@ -25,6 +56,7 @@ class Piece:
         self.attack = attack
         self.cost = cost
         self.sprite = None
+        self.kind = "piece"
         
 
     
@@ -129,31 +161,19 @@ class Knight(Piece):
     def get_valid_moves(self, board) -> List[Tuple[int, int]]:
         """Knight movement: L-shape (2+1) to empty squares or enemy pieces"""
         moves = []
-        knight_moves = [(-2, -1), (-2, 1), (-1, -2), (-1, 2),
-                       (1, -2), (1, 2), (2, -1), (2, 1)]
-        
-        for dr, dc in knight_moves:
-            new_row = self.row + dr
-            new_col = self.col + dc
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                target_piece = board[new_row][new_col]
-                if target_piece is None or (target_piece.color != self.color and target_piece.is_alive()):
-                    moves.append((new_row, new_col))
+        for new_row, new_col in KNIGHT_TARGETS[self.row][self.col]:
+            target_piece = board[new_row][new_col]
+            if target_piece is None or (target_piece.color != self.color and target_piece.is_alive()):
+                moves.append((new_row, new_col))
         return moves
 
     def get_attack_targets(self, board) -> List[Tuple[int, int]]:
         """Knight attack: Same L-shape pattern but targeting enemies"""
         targets = []
-        knight_moves = [(-2, -1), (-2, 1), (-1, -2), (-1, 2),
-                       (1, -2), (1, 2), (2, -1), (2, 1)]
-        
-        for dr, dc in knight_moves:
-            new_row = self.row + dr
-            new_col = self.col + dc
-            if (0 <= new_row < 8 and 0 <= new_col < 8):
-                target_piece = board[new_row][new_col]
-                if (target_piece and target_piece.color != self.color and target_piece.is_alive()):
-                    targets.append((new_row, new_col))
+        for new_row, new_col in KNIGHT_TARGETS[self.row][self.col]:
+            target_piece = board[new_row][new_col]
+            if (target_piece and target_piece.color != self.color and target_piece.is_alive()):
+                targets.append((new_row, new_col))
                     
         return targets
 
@@ -172,16 +192,8 @@ class Bishop(Piece):
     def get_valid_moves(self, board) -> List[Tuple[int, int]]:
         """Bishop movement: Diagonal paths to empty squares until blocked"""
         moves = []
-        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row = self.row + i * dr
-                new_col = self.col + i * dc
-                
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                    
+        for direction in BISHOP_DIRECTIONS:
+            for new_row, new_col in RAYS[direction][self.row][self.col]:
                 if board[new_row][new_col] is None:
                     moves.append((new_row, new_col))
                 else:
@@ -192,16 +204,8 @@ class Bishop(Piece):
     def get_attack_targets(self, board) -> List[Tuple[int, int]]:
         """Bishop attack: Attack first enemy found along diagonal paths"""
         targets = []
-        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row = self.row + i * dr
-                new_col = self.col + i * dc
-                
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                    
+        for direction in BISHOP_DIRECTIONS:
+            for new_row, new_col in RAYS[direction][self.row][self.col]:
                 target_piece = board[new_row][new_col]
                 if target_piece:
                     if target_piece.color != self.color and target_piece.is_alive():
@@ -226,16 +230,8 @@ class Rook(Piece):
     def get_valid_moves(self, board) -> List[Tuple[int, int]]:
         """Rook movement: Vertical/horizontal paths to empty squares until blocked"""
         moves = []
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row = self.row + i * dr
-                new_col = self.col + i * dc
-                
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                    
+        for direction in ROOK_DIRECTIONS:
+            for new_row, new_col in RAYS[direction][self.row][self.col]:
                 if board[new_row][new_col] is None:
                     moves.append((new_row, new_col))
                 else:
@@ -246,16 +242,8 @@ class Rook(Piece):
     def get_attack_targets(self, board) -> List[Tuple[int, int]]:
         """Rook attack: Attack first enemy found along vertical/horizontal paths"""
         targets = []
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row = self.row + i * dr
-                new_col = self.col + i * dc
-                
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                    
+        for direction in ROOK_DIRECTIONS:
+            for new_row, new_col in RAYS[direction][self.row][self.col]:
                 target_piece = board[new_row][new_col]
                 if target_piece:
                     if target_piece.color != self.color and target_piece.is_alive():
@@ -283,16 +271,8 @@ class Tower(Piece):
     def get_attack_targets(self, board) -> List[Tuple[int, int]]:
         """Rook attack: Attack first enemy found along vertical/horizontal paths"""
         targets = []
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row = self.row + i * dr
-                new_col = self.col + i * dc
-                
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                    
+        for direction in ROOK_DIRECTIONS:
+            for new_row, new_col in RAYS[direction][self.row][self.col]:
                 target_piece = board[new_row][new_col]
                 if target_piece:
                     if target_piece.color != self.color and target_piece.is_alive():
@@ -316,16 +296,8 @@ class Queen(Piece):
     def get_valid_moves(self, board) -> List[Tuple[int, int]]:
         """Queen movement: Combination of rook and bishop movement"""
         moves = []
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row = self.row + i * dr
-                new_col = self.col + i * dc
-                
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                    
+        for direction in QUEEN_DIRECTIONS:
+            for new_row, new_col in RAYS[direction][self.row][self.col]:
                 if board[new_row][new_col] is None:
                     moves.append((new_row, new_col))
                 else:
@@ -336,16 +308,8 @@ class Queen(Piece):
     def get_attack_targets(self, board) -> List[Tuple[int, int]]:
         """Queen attack: Attack first enemy in any straight or diagonal direction"""
         targets = []
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                new_row = self.row + i * dr
-                new_col = self.col + i * dc
-                
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                    
+        for direction in QUEEN_DIRECTIONS:
+            for new_row, new_col in RAYS[direction][self.row][self.col]:
                 target_piece = board[new_row][new_col]
                 if target_piece:
                     if target_piece.color != self.color and target_piece.is_alive():
@@ -369,14 +333,8 @@ class King(Piece):
     def get_valid_moves(self, board) -> List[Tuple[int, int]]:
         """King movement: 1 square in any direction to empty squares"""
         moves = []
-        directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), 
-                     (0, 1), (1, -1), (1, 0), (1, 1)]
-        
-        for dr, dc in directions:
-            new_row = self.row + dr
-            new_col = self.col + dc
-            if (0 <= new_row < 8 and 0 <= new_col < 8 and 
-                board[new_row][new_col] is None):  # Only empty squares for movement
+        for new_row, new_col in KING_TARGETS[self.row][self.col]:
+            if board[new_row][new_col] is None:  # Only empty squares for movement
                 moves.append((new_row, new_col))
                 
         return moves
@@ -384,15 +342,9 @@ class King(Piece):
     def get_attack_targets(self, board) -> List[Tuple[int, int]]:
         """King attack: Attack enemy in any adjacent square"""
         targets = []
-        directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), 
-                     (0, 1), (1, -1), (1, 0), (1, 1)]
-        
-        for dr, dc in directions:
-            new_row = self.row + dr
-            new_col = self.col + dc
-            if (0 <= new_row < 8 and 0 <= new_col < 8):
-                target_piece = board[new_row][new_col]
-                if (target_piece and target_piece.color != self.color and target_piece.is_alive()):
-                    targets.append((new_row, new_col))
+        for new_row, new_col in KING_TARGETS[self.row][self.col]:
+            target_piece = board[new_row][new_col]
+            if (target_piece and target_piece.color != self.color and target_piece.is_alive()):
+                targets.append((new_row, new_col))
                     
         return targets
\ No newline at end of file
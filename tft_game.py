@@ -3,7 +3,11 @@ from typing import Optional, List, Tuple, Dict
 from board import Board
 from piece import *
 from game import GameState
+import functools
+import itertools
+import math
 import random
+from collections import deque
 from enum import Enum
 from card import Card, CardType
 
@@ -13,6 +17,117 @@ class GamePhase(Enum):
     SHOP = "shop"
     END_ROUND = "end_round"
 
+# Concrete class for each buyable piece type
+PIECE_CLASSES = {
+    PieceType.PAWN: Pawn,
+    PieceType.KNIGHT: Knight,
+    PieceType.BISHOP: Bishop,
+    PieceType.ROOK: Rook,
+    PieceType.QUEEN: Queen,
+}
+
+# Coin cost per piece type; kings can't be bought
+PIECE_COSTS = {
+    PieceType.PAWN: 1,
+    PieceType.KNIGHT: 3,
+    PieceType.BISHOP: 3,
+    PieceType.ROOK: 5,
+    PieceType.QUEEN: 9,
+    PieceType.KING: 99,
+}
+
+# Shop piece odds: pawn most common, queen rarest. Cumulative weights let
+# random.choices skip re-accumulating the weights on every roll
+SHOP_PIECE_TYPES = (PieceType.PAWN, PieceType.KNIGHT, PieceType.BISHOP, PieceType.ROOK, PieceType.QUEEN)
+SHOP_PIECE_CUM_WEIGHTS = tuple(itertools.accumulate((40, 25, 20, 10, 5)))
+
+# Cards the shop can offer. Cards hold no per-game state, so one instance of
+# each is shared by every roll
+SHOP_CARDS = (
+    Card(CardType.ARROW_VOLLEY, True, "Hackathon_image/arrow_volley.png", "Arrow Volley", 5),
+    #Card(CardType.DISARM, False, "Hackathon_image/disarm.png", "Disarm", 3),
+    Card(CardType.REDEMPTION, True, "Hackathon_image/redemption.png", "Redemption", 5),
+    Card(CardType.LIGHTNING, True, "Hackathon_image/lightning.png", "Lightning", 5),
+    Card(CardType.TOWER, True, "Hackathon_image/tower_defense.png", "Tower Defense", 8),
+)
+
+# Grid rows each side may deploy into, and the hint logged for a drop outside them
+DEPLOY_ROWS = {Color.WHITE: range(6, 8), Color.BLACK: range(0, 2)}
+DEPLOY_ZONE_HINTS = {
+    Color.WHITE: "White can only deploy in rows 7-8 (bottom 2 rows)",
+    Color.BLACK: "Black can only deploy in rows 1-2 (top 2 rows)",
+}
+
+# Read-only shop display pieces; real pieces are only built when bought
+_PROTO_PIECES = {(pt, color): cls(color, 0, 0) for pt, cls in PIECE_CLASSES.items() for color in Color}
+
+# Combat animation length in ms, and its motion curves sampled per ms. Elapsed
+# time is always a whole number of ms, so the tables are exact, not approximate.
+COMBAT_ANIM_DURATION = 600
+_COMBAT_PROGRESS = [ms / COMBAT_ANIM_DURATION for ms in range(COMBAT_ANIM_DURATION + 1)]
+COMBAT_EASE = [0.5 - 0.5 * math.cos(math.pi * p) for p in _COMBAT_PROGRESS]  # Ease-in/ease-out
+COMBAT_JUMP = [int(-18 * math.sin(math.pi * p)) for p in _COMBAT_PROGRESS]  # Knight hop height
+COMBAT_SHAKE = [int(10 * math.sin(p * 12 * math.pi) * (1 - abs(0.5 - p) * 2)) if p > 0.6 else 0
+                for p in _COMBAT_PROGRESS]  # Defender shake
+
+# (share of the distance to the defender covered, hops) per attacker type:
+# knights jump, rooks/bishops slide, queens dash, kings lumber, pawns step
+ATTACK_MOTION = {
+    PieceType.KNIGHT: (0.7, True),
+    PieceType.ROOK: (0.8, False),
+    PieceType.BISHOP: (0.8, False),
+    PieceType.QUEEN: (1.0, False),
+    PieceType.KING: (0.5, False),
+    PieceType.PAWN: (0.6, False),
+}
+
+# Per-frame sprite batches: pygame-ce's fblits skips building the list of
+# dirty rects; plain pygame falls back to blits without returning them
+if hasattr(pygame.Surface, "fblits"):
+    def blit_batch(surface: pygame.Surface, blits) -> None:
+        surface.fblits(blits)
+else:
+    def blit_batch(surface: pygame.Surface, blits) -> None:
+        surface.blits(blits, doreturn=False)
+
+PIXEL_FONT_PATH = "Hackathon_image/pixel_font.ttf"
+
+# Fonts and decoded image files are process-wide: a reset builds a new TFTGame,
+# which then reuses them instead of reading and decoding the files again
+@functools.lru_cache(maxsize=8)
+def get_pixel_font(size: int) -> pygame.font.Font:
+    """The game's pixel font at the given size"""
+    return pygame.font.Font(PIXEL_FONT_PATH, size)
+
+@functools.lru_cache(maxsize=None)
+def read_image(path: str) -> pygame.Surface:
+    """Decoded image file, unconverted; treat the result as read-only"""
+    return pygame.image.load(path)
+
+@functools.lru_cache(maxsize=1)
+def get_symbol_font() -> pygame.font.Font:
+    """Font for the piece symbols, created on first use"""
+    return pygame.font.Font(None, 36)
+
+@functools.lru_cache(maxsize=32)
+def render_piece_symbol(symbol: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Rendered piece symbol; module-level so it survives a game reset (a new TFTGame)"""
+    return get_symbol_font().render(symbol, True, color)
+
+@functools.lru_cache(maxsize=32)
+def piece_symbol_offset(symbol: str, color: Tuple[int, int, int], box_size: int) -> Tuple[int, int]:
+    """Top-left offset that centers the rendered symbol in a box_size square"""
+    return render_piece_symbol(symbol, color).get_rect(center=(box_size // 2, box_size // 2)).topleft
+
+# Effect line shown in the hover window for each card
+CARD_EFFECT_TEXT = {
+    CardType.ARROW_VOLLEY: "Arrow Volley: -1 HP all units",
+    CardType.DISARM: "Disarm: Set attack=0",
+    CardType.REDEMPTION: "Redemption: black tiles take 1 dmg; white tiles gain 1 health",
+    CardType.LIGHTNING: "Lightning: 3 dmg to five random tiles on board",
+    CardType.TOWER: "Gain 2 rooks that cannot move.",
+}
+
 class TFTGame:
     def __init__(self, screen_width=1600, screen_height=1000):
         self.screen_width = screen_width
@@ -23,15 +138,28 @@ class TFTGame:
         board_offset_x = (screen_width - cell_size * 8) // 2
         board_offset_y = max(80, (screen_height - cell_size * 8) // 2)
         self.board = Board(cell_size=cell_size, board_offset_x=board_offset_x, board_offset_y=board_offset_y)
+        # Board geometry is fixed for the lifetime of the game, so bake it into
+        # the mouse lookups (default args are local loads, not attribute loads)
+        self.board.get_cell_from_mouse = lambda mx, my, cs=cell_size, ox=board_offset_x, oy=board_offset_y: ((my - oy) // cs, (mx - ox) // cs)
+        self.board.is_valid_position = lambda r, c: 0 <= r < 8 and 0 <= c < 8
         self.current_player = Color.WHITE
         self.selected_piece = None
         self.selected_row = -1
         self.selected_col = -1
         self.valid_moves = []
         self.attack_targets = []
+        # Set views of the two lists above for O(1) click checks
+        self.valid_move_cells = frozenset()
+        self.attack_target_cells = frozenset()
+        # (row, col) -> (moves, targets, move cells, target cells) for the current board;
+        # emptied by board_changed() whenever pieces move, appear or die
+        self.moves_cache = {}
+        # (row, col, piece) for every occupied cell, rebuilt on first draw after board_changed()
+        self.board_pieces = None
         self.game_state = GameState.PLAYING
         self.action_mode = "move"
-        self.game_log = []
+        self.game_log = deque(maxlen=8)  # (message, color, added_ms); oldest entries drop off automatically
+        self.log_count = 0  # Messages logged so far; tells draw_battle_log when the tail changed
         self.end = False
         
         # TFT-specific systems
@@ -41,6 +169,8 @@ class TFTGame:
         self.black_coins = 3
         self.white_reserve = []  # Reserve pieces
         self.black_reserve = []
+        self.white_army_value = 0  # Total cost of each reserve, kept in step by add_to_reserve/pop_from_reserve
+        self.black_army_value = 0
         self.white_shop_items = []  # White's shop
         self.black_shop_items = []  # Black's shop
         self.shop_open = True  # Shop starts open
@@ -67,7 +197,6 @@ class TFTGame:
         self.card_icons = {}
         self.load_assets()
         self.setup_initial_board()
-        self.generate_shop()
         
         # UI layout - adjusted to prevent overlap and screen size
         reserve_width = int(screen_width * 0.12)
@@ -81,15 +210,82 @@ class TFTGame:
         self.black_reserve_area = pygame.Rect(screen_width - reserve_width - 20, board_offset_y, reserve_width, reserve_height // 2)
         self.shop_area = pygame.Rect(screen_width - shop_width - 20, board_offset_y + reserve_height // 2 + 20, shop_width, shop_height)
         self.economy_panel_rect = pygame.Rect(screen_width - panel_width - 40, 40, panel_width, panel_height)
-        
+        log_width = int(screen_width * 0.45)
+        self.battle_log_area = pygame.Rect((screen_width - log_width) // 2, screen_height - 100 - 20, log_width, 100)
+
+        # Static UI layer, rebuilt by get_static_ui_layer when its key changes
+        self.static_ui_layer = None
+        self.board_panel_overlaps = []  # Layer rects where panel chrome covers board cells
+        self.static_ui_key = None
+        # Move/attack highlights for the current selection
+        self.highlight_overlay = None
+        self.highlight_key = None
+        # Economy row blits and the state they were built for
+        self.economy_blits = []
+        self.economy_blits_key = None
+        # Per-player (key, blits...) for the reserve slots and open shop items,
+        # replayed until the pieces, items, coins or flicker phase change
+        self.reserve_blits = {}
+        self.shop_panel_blits = {}
+        # Battle log line blits and the (log count, typed chars) they were built for
+        self.log_blits = []
+        self.log_blits_key = None
+        # Title, phase, turn and mode blits and the state they were built for
+        self.header_blits = []
+        self.header_blits_key = None
+
+        # Click hit-boxes for reserve and shop slots - matches drawing layout
+        self.white_reserve_slots = self.build_reserve_slots(self.white_reserve_area)
+        self.black_reserve_slots = self.build_reserve_slots(self.black_reserve_area)
+        self.white_shop_slots = self.build_shop_slots(self.white_shop_area)
+        self.black_shop_slots = self.build_shop_slots(self.shop_area)
+        # Visible item boxes inside the shop slots, shared by drawing and hover
+        self.white_shop_item_rects = self.build_shop_item_rects(self.white_shop_area)
+        self.black_shop_item_rects = self.build_shop_item_rects(self.shop_area)
+        # Click dispatch in priority order: (area, handler(mouse_x, mouse_y), only while the shop is open)
+        self.click_regions = (
+            (self.shop_area, self.handle_shop_click, True),
+            (self.white_shop_area, self.handle_shop_click, True),
+            (self.white_reserve_area, functools.partial(self.handle_reserve_click, player=Color.WHITE), False),
+            (self.black_reserve_area, functools.partial(self.handle_reserve_click, player=Color.BLACK), False),
+            (self.board.board_rect, self.handle_board_click, False),
+        )
+
+        # Shop slot surfaces depend on the shop layout, so stock the shop last
+        if self.red_overlay_image:
+            self.unaffordable_overlay = pygame.transform.scale(self.red_overlay_image, (shop_width - 24, 56))
+        else:
+            self.unaffordable_overlay = pygame.Surface((shop_width - 24, 56), pygame.SRCALPHA)
+            self.unaffordable_overlay.fill((255, 0, 0, 120))
+        self.shop_item_surfaces = {}
+        self.generate_shop()
+        self.prerender_sprites()
+
+    def build_reserve_slots(self, area: pygame.Rect) -> Tuple[Tuple[pygame.Rect, int], ...]:
+        """Precompute (rect, reserve_index) hit-boxes: 3 per row, 10px left margin, 30px title"""
+        return tuple(
+            (pygame.Rect(area.x + 10 + col * 55, area.y + 30 + row * 60, 55, 60).clip(area), row * 3 + col)
+            for row in range(4) for col in range(3)
+        )
+
+    def build_shop_slots(self, area: pygame.Rect) -> Tuple[Tuple[pygame.Rect, int], ...]:
+        """Precompute (rect, shop_index) hit-boxes: one 65px row per item below the 40px title"""
+        return tuple(
+            (pygame.Rect(area.x, area.y + 40 + i * 65, area.width, 65).clip(area), i)
+            for i in range(5)
+        )
+
+    def build_shop_item_rects(self, area: pygame.Rect) -> Tuple[pygame.Rect, ...]:
+        """Precompute the drawn item boxes: 56px tall, 12px inset, 48px down with a 65px stride"""
+        return tuple(pygame.Rect(area.x + 12, area.y + 48 + i * 65, area.width - 24, 56) for i in range(5))
         
     def load_assets(self):
         pygame.font.init()
         # Load pixel font provided by user
-        PIXEL_FONT_PATH = "Hackathon_image/pixel_font.ttf"  # Replace with actual filename
-        self.font = pygame.font.Font(PIXEL_FONT_PATH, 28)
-        self.title_font = pygame.font.Font(PIXEL_FONT_PATH, 40)
-        self.small_font = pygame.font.Font(PIXEL_FONT_PATH, 22)
+        self.font = get_pixel_font(28)
+        self.title_font = get_pixel_font(40)
+        self.small_font = get_pixel_font(22)  # Also used by the hover window
+        self.empty_slot_font = get_pixel_font(12)
 
         # Retro color palette
         self.palette = {
@@ -105,6 +301,18 @@ class TFTGame:
             "black": (0, 0, 0),
         }
 
+        # Reserve slot pixel frame (50x55 with pixel corners), stamped once per slot
+        slot_width, slot_height = 50, 55
+        self.reserve_slot_frame = pygame.Surface((slot_width, slot_height))
+        self.reserve_slot_frame.fill(self.palette["bg"])
+        pygame.draw.rect(self.reserve_slot_frame, self.palette["border"], (0, 0, slot_width, slot_height), 3)
+        for corner_x, corner_y in ((0, 0), (slot_width - 7, 0), (0, slot_height - 7), (slot_width - 7, slot_height - 7)):
+            self.reserve_slot_frame.fill(self.palette["border"], (corner_x, corner_y, 7, 7))
+        # Flickering "EMPTY" label and its offset to the centre of a slot
+        self.empty_slot_label = self.empty_slot_font.render("EMPTY", True, self.palette["neon_yellow"])
+        self.empty_slot_offset = (slot_width // 2 - self.empty_slot_label.get_width() // 2,
+                                  slot_height // 2 - self.empty_slot_label.get_height() // 2)
+
         # Load piece sprites from Hackathon_image directory
         self.piece_sprites = {}
         piece_files = {
@@ -119,7 +327,7 @@ class TFTGame:
         for piece_type, filename in piece_files.items():
             try:
                 sprite_path = f"Hackathon_image/{filename}"
-                sprite = pygame.image.load(sprite_path)
+                sprite = self.load_image(sprite_path)
                 self.piece_sprites[piece_type] = sprite
                 print(f"Loaded sprite for {piece_type.value}")
             except Exception as e:
@@ -137,14 +345,134 @@ class TFTGame:
         for card_type, filename in card_icon_files.items():
             try:
                 icon_path = f"Hackathon_image/{filename}"
-                icon = pygame.image.load(icon_path)
+                icon = self.load_image(icon_path)
                 self.card_icons[card_type] = icon
             except Exception:
                 # Placeholder: colored square
                 surf = pygame.Surface((40, 40))
                 surf.fill((200, 200, 100) if card_type == CardType.ARROW_VOLLEY else (180, 80, 80))
                 self.card_icons[card_type] = surf
+        # Shop slots show card icons at 32x32, so scale them once here
+        for card_type, icon in self.card_icons.items():
+            self.card_icons[card_type] = pygame.transform.scale(icon, (32, 32))
+
+        # Shop decorations, loaded once (either may be missing)
+        try:
+            self.coin_icon = pygame.transform.scale(self.load_image("Hackathon_image/coin.png"), (18, 18))
+        except Exception:
+            self.coin_icon = None
+        try:
+            self.red_overlay_image = self.load_image("Hackathon_image/red_overlay.png")
+        except Exception:
+            self.red_overlay_image = None
+
+        # Scaled (and optionally black-tinted) sprites, built on first use
+        self.scaled_sprite_cache = {}
+        self.board_sprite_cache = {}
+        self.tint_overlays = {}
+        # HP bars keyed by (bar width, filled width, track color, fill color)
+        self.hp_bar_cache = {}
+        # Rendered text as (surface, width, height), keyed by (font, text, color)
+        self.text_cache = {}
+        # Last hover window, reused while its text is unchanged
+        self.hover_cache_lines = None
+        self.hover_cache_surface = None
+
+    def load_image(self, path: str) -> pygame.Surface:
+        """Load an image, converted to the display's pixel format when a display is set"""
+        image = read_image(path)
+        if not pygame.display.get_surface():
+            return image
+        # Converted surfaces blit without a per-pixel format conversion;
+        # opaque images stay opaque so they keep the faster non-alpha blit
+        return image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+
+    def render_cached(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """font.render(text, True, color), memoized; oldest entries are evicted past 512"""
+        return self.render_cached_sized(font, text, color)[0]
+
+    def render_cached_sized(self, font: pygame.font.Font, text: str, color) -> Tuple[pygame.Surface, int, int]:
+        """Like render_cached, but returns (surface, width, height) for centering"""
+        key = (id(font), text, color)
+        entry = self.text_cache.get(key)
+        if entry is None:
+            surface = font.render(text, True, color)
+            entry = (surface, surface.get_width(), surface.get_height())
+            if len(self.text_cache) >= 512:
+                del self.text_cache[next(iter(self.text_cache))]
+            self.text_cache[key] = entry
+        return entry
+
+    def get_board_sprite(self, piece_type: PieceType, color: Color) -> Optional[pygame.Surface]:
+        """Board-sized piece sprite with its 2px color border baked in; blit at cell + (3, 3)"""
+        key = (piece_type, color)
+        cached = self.board_sprite_cache.get(key)
+        if cached is None:
+            piece_size = self.board.cell_size - 10
+            scaled_sprite = self.get_scaled_sprite(piece_type, piece_size, 100 if color == Color.BLACK else 0)
+            if not scaled_sprite:
+                return None
+            # Border to distinguish colors better
+            border_color = (255, 255, 255) if color == Color.WHITE else (150, 50, 50)
+            cached = pygame.Surface((piece_size + 4, piece_size + 4), scaled_sprite.get_flags() & pygame.SRCALPHA)
+            cached.blit(scaled_sprite, (2, 2))
+            pygame.draw.rect(cached, border_color, cached.get_rect(), 2)
+            self.board_sprite_cache[key] = cached
+        return cached
+
+    def get_tint_overlay(self, size: int, tint_alpha: int) -> pygame.Surface:
+        """Translucent dark-red square used to tint black pieces, shared per size/alpha"""
+        key = (size, tint_alpha)
+        overlay = self.tint_overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface((size, size))
+            overlay.set_alpha(tint_alpha)
+            overlay.fill((100, 50, 50))
+            self.tint_overlays[key] = overlay
+        return overlay
+
+    def get_hp_bar(self, bar_width: int, health_width: int,
+                   track_color=(200, 50, 50), fill_color=(50, 200, 50)) -> pygame.Surface:
+        """6px HP bar (track, fill, white outline), built once per width/fill/colors"""
+        key = (bar_width, health_width, track_color, fill_color)
+        bar = self.hp_bar_cache.get(key)
+        if bar is None:
+            bar_height = 6
+            bar = pygame.Surface((bar_width, bar_height))
+            bar.fill(track_color)
+            bar.fill(fill_color, (0, 0, health_width, bar_height))
+            pygame.draw.rect(bar, (255, 255, 255), (0, 0, bar_width, bar_height), 1)
+            self.hp_bar_cache[key] = bar
+        return bar
+
+    def get_scaled_sprite(self, piece_type: PieceType, size: int, tint_alpha: int = 0) -> Optional[pygame.Surface]:
+        """Return the piece sprite scaled to size x size, darkened for black when tint_alpha > 0"""
+        key = (piece_type, size, tint_alpha)
+        cached = self.scaled_sprite_cache.get(key)
+        if cached is None:
+            sprite = self.piece_sprites.get(piece_type)
+            if not sprite:
+                return None
+            if sprite.get_size() != (size, size):
+                cached = pygame.transform.scale(sprite, (size, size))
+            else:
+                # Already the right size; only copy when the tint would modify it
+                cached = sprite.copy() if tint_alpha else sprite
+            if tint_alpha:
+                cached.blit(self.get_tint_overlay(size, tint_alpha), (0, 0))
+            self.scaled_sprite_cache[key] = cached
+        return cached
                 
+    def prerender_sprites(self):
+        """Fill the sprite cache for the board and reserve sizes so the first frames don't scale"""
+        board_size = self.board.cell_size - 10
+        reserve_size = 50 - 12
+        for piece_type in self.piece_sprites:
+            for size, tint_alpha in ((board_size, 0), (board_size, 100), (reserve_size, 0), (reserve_size, 80)):
+                self.get_scaled_sprite(piece_type, size, tint_alpha)
+            for color in Color:
+                self.get_board_sprite(piece_type, color)
+
     def setup_initial_board(self):
         # Clear board first
         self.board.grid = [[None for _ in range(8)] for _ in range(8)]
@@ -163,74 +491,44 @@ class TFTGame:
         self.board.grid[1][3] = Pawn(Color.BLACK, 1, 3)
         self.board.grid[1][4] = Pawn(Color.BLACK, 1, 4)
         self.board.grid[1][5] = Pawn(Color.BLACK, 1, 5)
+        self.board.track_kings()
+        self.board_changed()
         
     def generate_shop(self):
         """Generate 5 random items for each shop: pieces, cards, consumables"""
-        piece_types = [PieceType.PAWN, PieceType.KNIGHT, PieceType.BISHOP, 
-                      PieceType.ROOK, PieceType.QUEEN]
-        weights = [40, 25, 20, 10, 5]  # Pawn most common, Queen rarest
 
         self.white_shop_items = []
         self.black_shop_items = []
-        for _ in range(5):
+        # Draw both sides' piece types for all five slots in one call each
+        white_types = random.choices(SHOP_PIECE_TYPES, cum_weights=SHOP_PIECE_CUM_WEIGHTS, k=5)
+        black_types = random.choices(SHOP_PIECE_TYPES, cum_weights=SHOP_PIECE_CUM_WEIGHTS, k=5)
+        for wt, bt in zip(white_types, black_types):
             roll = random.random()
             if roll < 0.5:
                 # Piece (50%)
-                wt = random.choices(piece_types, weights=weights)[0]
-                if wt == PieceType.PAWN:
-                    white_new_piece = Pawn(Color.WHITE, 0, 0)
-                if wt == PieceType.KNIGHT:
-                    white_new_piece = Knight(Color.WHITE, 0, 0)
-                if wt == PieceType.BISHOP:
-                    white_new_piece = Bishop(Color.WHITE, 0, 0)
-                if wt == PieceType.ROOK:
-                    white_new_piece = Rook(Color.WHITE, 0, 0)
-                if wt == PieceType.QUEEN:
-                    white_new_piece = Queen(Color.WHITE, 0, 0)
-                bt = random.choices(piece_types, weights=weights)[0]
-                if bt == PieceType.PAWN:
-                    black_new_piece = Pawn(Color.BLACK, 0, 0)
-                if bt == PieceType.KNIGHT:
-                    black_new_piece = Knight(Color.BLACK, 0, 0)
-                if bt == PieceType.BISHOP:
-                    black_new_piece = Bishop(Color.BLACK, 0, 0)
-                if bt == PieceType.ROOK:
-                    black_new_piece = Rook(Color.BLACK, 0, 0)
-                if bt == PieceType.QUEEN:
-                    black_new_piece = Queen(Color.BLACK, 0, 0)
-                self.white_shop_items.append(white_new_piece)
-                self.black_shop_items.append(black_new_piece)
+                self.white_shop_items.append(_PROTO_PIECES[(wt, Color.WHITE)])
+                self.black_shop_items.append(_PROTO_PIECES[(bt, Color.BLACK)])
             elif roll < 0.8:
                 # Card (30%)
-                arrow_card = Card(CardType.ARROW_VOLLEY, True, "Hackathon_image/arrow_volley.png", "Arrow Volley", 5)
-                #disarm_card = Card(CardType.DISARM, False, "Hackathon_image/disarm.png", "Disarm", 3)
-                redemption_card = Card(CardType.REDEMPTION, True, "Hackathon_image/redemption.png", "Redemption", 5)
-                lightning_card = Card(CardType.LIGHTNING, True, "Hackathon_image/lightning.png", "Lightning", 5)
-                tower_card = Card(CardType.TOWER, True, "Hackathon_image/tower_defense.png", "Tower Defense", 8)
-                # Randomly pick one card
-                wc = random.choice([arrow_card, redemption_card, lightning_card, tower_card])
-                bc = random.choice([arrow_card, redemption_card, lightning_card, tower_card])
+                wc = random.choice(SHOP_CARDS)
+                bc = random.choice(SHOP_CARDS)
                 self.white_shop_items.append(wc)
                 self.black_shop_items.append(bc)
             else:
                 # Consumable (20%)
                 # Placeholder: leave as is, or add your consumable logic here
-                wt = random.choices(piece_types, weights=weights)[0]
-                bt = random.choices(piece_types, weights=weights)[0]
-                self.white_shop_items.append(Piece(wt, Color.WHITE, 0, 0))
-                self.black_shop_items.append(Piece(bt, Color.BLACK, 0, 0))
+                self.white_shop_items.append(_PROTO_PIECES[(wt, Color.WHITE)])
+                self.black_shop_items.append(_PROTO_PIECES[(bt, Color.BLACK)])
+
+        # Prebuild the slot surface for any item type not seen yet
+        for item in self.white_shop_items + self.black_shop_items:
+            key = self.shop_item_key(item)
+            if key not in self.shop_item_surfaces:
+                self.shop_item_surfaces[key] = self.build_shop_item_surface(item)
             
     def get_piece_cost(self, piece_type: PieceType) -> int:
         """Get the cost of a piece type"""
-        costs = {
-            PieceType.PAWN: 1,
-            PieceType.KNIGHT: 3,
-            PieceType.BISHOP: 3,
-            PieceType.ROOK: 5,
-            PieceType.QUEEN: 9,
-            PieceType.KING: 99  # Can't buy kings
-        }
-        return costs.get(piece_type, 99)
+        return PIECE_COSTS.get(piece_type, 99)
         
     def can_afford(self, player: Color, piece_type: PieceType) -> bool:
         """Check if player can afford a piece"""
@@ -246,7 +544,7 @@ class TFTGame:
 
         item = shop_list[shop_index]
         # Handle Card purchase
-        if isinstance(item, Card):
+        if item.kind == "card":
             cost = item.cost
             coins = self.white_coins if player == Color.WHITE else self.black_coins
             if coins < cost:
@@ -259,42 +557,51 @@ class TFTGame:
             # Immediate effect
             if item.immediate:
                 item.apply_effect(self, player)
+                self.board_changed()
             elif not item.immediate and item.card_type == CardType.DISARM:
                 # Disarm: add to inventory
                 if player == Color.WHITE:
                     self.white_card_inventory.append(item)
                 else:
                     self.black_card_inventory.append(item)
-                self.add_to_log(f"{player.value.title()} bought Disarm card (stored in inventory).")
+                self.add_to_log(f"{COLOR_NAMES[player]} bought Disarm card (stored in inventory).")
             # Remove from shop
             shop_list.pop(shop_index)
             return True
         # Handle Piece purchase
-        if item.piece_type == PieceType.PAWN:
-            new_piece = Pawn(Color.WHITE, 0, 0)
-        if item.piece_type == PieceType.KNIGHT:
-            new_piece = Knight(Color.WHITE, 0, 0)
-        if item.piece_type == PieceType.BISHOP:
-            new_piece = Bishop(Color.WHITE, 0, 0)
-        if item.piece_type == PieceType.ROOK:
-            new_piece = Rook(Color.WHITE, 0, 0)
-        if item.piece_type == PieceType.QUEEN:
-            new_piece = Queen(Color.WHITE, 0, 0)
-
         cost = self.get_piece_cost(item.piece_type)
         if not self.can_afford(player, item.piece_type):
             return False
+        # Shop entries are shared prototypes - build the real piece only now
+        new_piece = PIECE_CLASSES[item.piece_type](player, 0, 0)
         if player == Color.WHITE:
             self.white_coins -= cost
-            self.white_reserve.append(new_piece)
         else:
             self.black_coins -= cost
-            new_piece.color = Color.BLACK
-            self.black_reserve.append(new_piece)
+        self.add_to_reserve(player, new_piece)
         shop_list.pop(shop_index)
-        self.add_to_log(f"{player.value.title()} bought {item.piece_type.value.title()} for {cost} coins")
+        self.add_to_log(f"{COLOR_NAMES[player]} bought {PIECE_NAMES[item.piece_type]} for {cost} coins")
         return True
         
+    def add_to_reserve(self, player: Color, piece: Piece):
+        """Add a piece to a player's reserve and update their army value"""
+        if player == Color.WHITE:
+            self.white_reserve.append(piece)
+            self.white_army_value += self.get_piece_cost(piece.piece_type)
+        else:
+            self.black_reserve.append(piece)
+            self.black_army_value += self.get_piece_cost(piece.piece_type)
+
+    def pop_from_reserve(self, player: Color, reserve_index: int) -> Piece:
+        """Remove and return the piece at reserve_index and update the player's army value"""
+        if player == Color.WHITE:
+            piece = self.white_reserve.pop(reserve_index)
+            self.white_army_value -= self.get_piece_cost(piece.piece_type)
+        else:
+            piece = self.black_reserve.pop(reserve_index)
+            self.black_army_value -= self.get_piece_cost(piece.piece_type)
+        return piece
+
     def deploy_from_reserve(self, player: Color, reserve_index: int, board_row: int, board_col: int) -> bool:
         """Deploy piece from reserve to board"""
         if player == Color.WHITE:
@@ -316,17 +623,15 @@ class TFTGame:
         piece.row = board_row
         piece.col = board_col
         self.board.grid[board_row][board_col] = piece
+        self.board_changed()
         
-        if player == Color.WHITE:
-            self.white_reserve.remove(piece)
-        else:
-            self.black_reserve.remove(piece)
+        self.pop_from_reserve(player, reserve_index)
         
         # Play placement/click sound
         if self.snd_click:
             self.snd_click.play()
             
-        self.add_to_log(f"{player.value.title()} deployed {piece.piece_type.value.title()}")
+        self.add_to_log(f"{COLOR_NAMES[player]} deployed {PIECE_NAMES[piece.piece_type]}")
         return True
         
     def start_battle_phase(self):
@@ -383,16 +688,24 @@ class TFTGame:
             
         if killer_color == Color.WHITE:
             self.white_coins += reward
-            self.add_to_log(f"White gains {reward} coins for killing {dead_piece.piece_type.value.title()}")
+            self.add_to_log(f"White gains {reward} coins for killing {PIECE_NAMES[dead_piece.piece_type]}")
         else:
             self.black_coins += reward
-            self.add_to_log(f"Black gains {reward} coins for killing {dead_piece.piece_type.value.title()}")
+            self.add_to_log(f"Black gains {reward} coins for killing {PIECE_NAMES[dead_piece.piece_type]}")
             
     def add_to_log(self, message: str):
-        """Add message to game log"""
-        self.game_log.append(message)
-        if len(self.game_log) > 8:
-            self.game_log.pop(0)
+        """Add message to game log, color coded once here rather than on every draw"""
+        # Color code: red for damage, green for heals, yellow for gold
+        if "damage" in message or "attack" in message:
+            color = self.palette["neon_red"]
+        elif "heal" in message or "HP" in message:
+            color = self.palette["neon_green"]
+        elif "coin" in message or "gold" in message:
+            color = self.palette["neon_yellow"]
+        else:
+            color = self.palette["neon_green"]
+        self.game_log.append((message, color, pygame.time.get_ticks()))
+        self.log_count += 1
 
     def handle_mouse_down(self, mouse_x: int, mouse_y: int):
         """Start dragging if click on reserve piece"""
@@ -431,10 +744,10 @@ class TFTGame:
         # Try deploying to board
         row, col = self.board.get_cell_from_mouse(mouse_x, mouse_y)
         if self.try_deploy_to_position(player, self.dragging_index, row, col):
-            self.add_to_log(f"{player.value.title()} deployed {self.dragging_piece.piece_type.value.title()} to {chr(ord('a')+col)}{8-row}")
+            self.add_to_log(f"{COLOR_NAMES[player]} deployed {PIECE_NAMES[self.dragging_piece.piece_type]} to {chr(ord('a')+col)}{8-row}")
         else:
             # Return to reserve
-            self.add_to_log(f"Cannot deploy {self.dragging_piece.piece_type.value.title()} there. Returned to reserve.")
+            self.add_to_log(f"Cannot deploy {PIECE_NAMES[self.dragging_piece.piece_type]} there. Returned to reserve.")
 
         # Clear dragging state
         self.dragging_piece = None
@@ -446,65 +759,32 @@ class TFTGame:
     # Add methods from original game for compatibility
     def handle_click(self, mouse_x: int, mouse_y: int):
         """Handle mouse clicks - extended for TFT features"""
-        # Handle shop clicks
-        if self.shop_open and (self.shop_area.collidepoint(mouse_x, mouse_y) or self.white_shop_area.collidepoint(mouse_x, mouse_y)):
-            self.handle_shop_click(mouse_x, mouse_y)
-            return
-            
-        # Handle reserve clicks
-        if self.white_reserve_area.collidepoint(mouse_x, mouse_y):
-            self.handle_reserve_click(mouse_x, mouse_y, Color.WHITE)
-            return
-        elif self.black_reserve_area.collidepoint(mouse_x, mouse_y):
-            self.handle_reserve_click(mouse_x, mouse_y, Color.BLACK)
-            return
-            
-        # Handle board clicks 
-        # Check if click is in board area
-        board_area = pygame.Rect(
-            self.board.board_offset_x,
-            self.board.board_offset_y,
-            8 * self.board.cell_size,
-            8 * self.board.cell_size
-        )
-        
-        if board_area.collidepoint(mouse_x, mouse_y):
-            self.handle_board_click(mouse_x, mouse_y)
-            return
+        # Shop, then reserves, then board; a closed shop lets clicks fall through
+        for area, handler, needs_shop in self.click_regions:
+            if area.collidepoint(mouse_x, mouse_y) and (self.shop_open or not needs_shop):
+                handler(mouse_x, mouse_y)
+                return
             
     def handle_shop_click(self, mouse_x: int, mouse_y: int):
         """Handle clicks on shop items for both white and black shops"""
         if not self.shop_open:
             return
 
-        shop_width = self.shop_area.width
-        shop_height = self.shop_area.height
-        white_shop_rect = self.white_shop_area
-        black_shop_rect = self.shop_area
-
         # Check white shop
-        if white_shop_rect.collidepoint(mouse_x, mouse_y):
-            relative_x = mouse_x - white_shop_rect.x
-            relative_y = mouse_y - white_shop_rect.y
-            if relative_y >= 40:
-                shop_index = (relative_y - 40) // 65
-            else:
-                shop_index = -1
-            if 0 <= shop_index < len(self.white_shop_items):
-                self.buy_piece(Color.WHITE, shop_index)
-                return
+        for rect, shop_index in self.white_shop_slots:
+            if rect.collidepoint(mouse_x, mouse_y):
+                if shop_index < len(self.white_shop_items):
+                    self.buy_piece(Color.WHITE, shop_index)
+                    return
+                break
 
         # Check black shop
-        if black_shop_rect.collidepoint(mouse_x, mouse_y):
-            relative_x = mouse_x - black_shop_rect.x
-            relative_y = mouse_y - black_shop_rect.y
-            if relative_y >= 40:
-                shop_index = (relative_y - 40) // 65
-            else:
-                shop_index = -1
-            if 0 <= shop_index < len(self.black_shop_items):
-                self.buy_piece(Color.BLACK, shop_index)
-                return
+        for rect, shop_index in self.black_shop_slots:
+            if rect.collidepoint(mouse_x, mouse_y):
+                if shop_index < len(self.black_shop_items):
+                    self.buy_piece(Color.BLACK, shop_index)
+                    return
+                break
                 
     def handle_reserve_click(self, mouse_x: int, mouse_y: int, player: Color):
         """Handle clicks on reserve area for deployment"""
@@ -512,48 +792,28 @@ class TFTGame:
             return
             
         reserve = self.white_reserve if player == Color.WHITE else self.black_reserve
-        area = self.white_reserve_area if player == Color.WHITE else self.black_reserve_area
-        
-        # Calculate which piece was clicked
-        relative_x = mouse_x - area.x
-        relative_y = mouse_y - area.y
-        
-        if relative_y < 25:  # Clicked on title area
-            return
-            
-        # Layout for reserves - matches drawing layout
-        pieces_per_row = 3
-        slot_width = 55
-        slot_height = 60
-        
-        adjusted_y = relative_y - 30  # Match drawing offset
-        if adjusted_y < 0:
-            return
-            
-        col = (relative_x - 10) // slot_width  # Account for 10px left margin
-        row = adjusted_y // slot_height
-        
-        if col >= pieces_per_row:
-            return
-            
-        piece_index = row * pieces_per_row + col
-        
-        if 0 <= piece_index < len(reserve):
-            piece = reserve[piece_index]
-            self.add_to_log(f"Selected {piece.piece_type.value.title()} from reserve - drag to board to deploy!")
-            return piece_index
+        slots = self.white_reserve_slots if player == Color.WHITE else self.black_reserve_slots
+        
+        # Find which slot was clicked
+        for rect, piece_index in slots:
+            if rect.collidepoint(mouse_x, mouse_y):
+                if piece_index < len(reserve):
+                    piece = reserve[piece_index]
+                    self.add_to_log(f"Selected {PIECE_NAMES[piece.piece_type]} from reserve - drag to board to deploy!")
+                    return piece_index
+                break
         
         return None
         
     def handle_deployment_click(self, mouse_x: int, mouse_y: int):
         """Handle deployment of pieces from reserve to board during setup"""
-        row, col = self.board.get_cell_from_mouse(mouse_x, mouse_y)
-        
-        if not self.board.is_valid_position(row, col):
+        cell = self.board.get_cell_at(mouse_x, mouse_y)
+        if cell is None:
             return
+        row, col = cell
             
         # Check if position is empty
-        if self.board.get_piece_at(row, col) is not None:
+        if self.board.grid[row][col] is not None:
             self.add_to_log("Position is occupied!")
             return
             
@@ -562,12 +822,12 @@ class TFTGame:
         reserve = self.white_reserve if player == Color.WHITE else self.black_reserve
         
         if not reserve:
-            self.add_to_log(f"No pieces in {player.value.title()} reserve to deploy!")
+            self.add_to_log(f"No pieces in {COLOR_NAMES[player]} reserve to deploy!")
             return
             
         # For simplicity, deploy the first piece in reserve (can be enhanced to show selection UI)
         if self.try_deploy_to_position(player, 0, row, col):
-            self.add_to_log(f"{player.value.title()} deployed piece to {chr(ord('a')+col)}{8-row}")
+            self.add_to_log(f"{COLOR_NAMES[player]} deployed piece to {chr(ord('a')+col)}{8-row}")
         
     def try_deploy_to_position(self, player: Color, reserve_index: int, row: int, col: int) -> bool:
         """Try to deploy a piece from reserve to a specific board position"""
@@ -577,11 +837,8 @@ class TFTGame:
             return False
             
         # Check deployment zones
-        if player == Color.WHITE and not (6 <= row <= 7):
-            self.add_to_log("White can only deploy in rows 7-8 (bottom 2 rows)")
-            return False
-        elif player == Color.BLACK and not (0 <= row <= 1):
-            self.add_to_log("Black can only deploy in rows 1-2 (top 2 rows)")
+        if row not in DEPLOY_ROWS[player]:
+            self.add_to_log(DEPLOY_ZONE_HINTS[player])
             return False
             
         if not (0 <= col <= 7):
@@ -596,7 +853,8 @@ class TFTGame:
         piece.row = row
         piece.col = col
         self.board.grid[row][col] = piece
-        reserve.remove(piece)
+        self.board_changed()
+        self.pop_from_reserve(player, reserve_index)
         
         return True
         
@@ -611,12 +869,11 @@ class TFTGame:
         if self.phase != GamePhase.BATTLE:
             return
             
-        row, col = self.board.get_cell_from_mouse(mouse_x, mouse_y)
-        
-        if not self.board.is_valid_position(row, col):
+        cell = self.board.get_cell_at(mouse_x, mouse_y)
+        if cell is None:
             return
-            
-        clicked_piece = self.board.get_piece_at(row, col)
+        row, col = cell
+        clicked_piece = self.board.grid[row][col]
         
         # If no piece is selected
         if self.selected_piece is None:
@@ -628,10 +885,10 @@ class TFTGame:
             if row == self.selected_row and col == self.selected_col:
                 self.deselect_piece()
             # If clicking on a valid move
-            elif (row, col) in self.valid_moves and self.action_mode == "move":
+            elif (row, col) in self.valid_move_cells and self.action_mode == "move":
                 self.make_move(self.selected_row, self.selected_col, row, col)
             # If clicking on a valid attack target
-            elif (row, col) in self.attack_targets and self.action_mode == "attack":
+            elif (row, col) in self.attack_target_cells and self.action_mode == "attack":
                 self.make_attack(self.selected_row, self.selected_col, row, col)
             # If clicking on another piece of the current player
             elif clicked_piece and clicked_piece.is_alive() and clicked_piece.color == self.current_player:
@@ -644,10 +901,30 @@ class TFTGame:
         self.selected_piece = piece
         self.selected_row = row
         self.selected_col = col
-        self.valid_moves = piece.get_valid_moves(self.board.grid)
-        self.attack_targets = piece.get_attack_targets(self.board.grid)
+        # Re-selecting a piece on an unchanged board reuses the last generation
+        cached = self.moves_cache.get((row, col))
+        if cached is None:
+            moves = piece.get_valid_moves(self.board.grid)
+            targets = piece.get_attack_targets(self.board.grid)
+            cached = (moves, targets, frozenset(moves), frozenset(targets))
+            self.moves_cache[(row, col)] = cached
+        self.valid_moves, self.attack_targets, self.valid_move_cells, self.attack_target_cells = cached
         self.action_mode = "move"
-        
+
+    def board_changed(self):
+        """Drop cached move generation; call after any change to the pieces on the board"""
+        self.moves_cache.clear()
+        self.board_pieces = None
+        
+    def get_board_pieces(self) -> List[Tuple[int, int, Piece]]:
+        """(row, col, piece) for every occupied board cell, cached until board_changed()"""
+        if self.board_pieces is None:
+            self.board_pieces = [(row, col, piece)
+                                 for row, grid_row in enumerate(self.board.grid)
+                                 for col, piece in enumerate(grid_row)
+                                 if piece is not None]
+        return self.board_pieces
+
     def deselect_piece(self):
         """Deselect current piece"""
         self.selected_piece = None
@@ -655,6 +932,8 @@ class TFTGame:
         self.selected_col = -1
         self.valid_moves = []
         self.attack_targets = []
+        self.valid_move_cells = frozenset()
+        self.attack_target_cells = frozenset()
         self.action_mode = "move"
         
     def make_move(self, from_row: int, from_col: int, to_row: int, to_col: int):
@@ -670,10 +949,9 @@ class TFTGame:
         target_piece = self.board.get_piece_at(to_row, to_col)
         if target_piece is None:  # Only move to empty squares
             self.board.move_piece(from_row, from_col, to_row, to_col)
+            self.board_changed()
             
-        self.actions_taken[self.current_player] = True
-        if all(self.actions_taken.values()):
-            self.end_battle_phase()
+        self.mark_action_taken()
         self.deselect_piece()
         self.switch_player()
         self.check_battle_end()
@@ -702,33 +980,37 @@ class TFTGame:
             "attacker_pos": (attacker_row, attacker_col),
             "defender_pos": (target_row, target_col)
         }
-        self.actions_taken[self.current_player] = True
-        if all(self.actions_taken.values()):
-            self.end_battle_phase()
+        self.mark_action_taken()
 
         # Handle combat after animation (delayed)
         # The actual damage and removal will be handled after animation in draw()
 
     
+    def mark_action_taken(self):
+        """Record the current player's action and end the battle once both have acted"""
+        self.actions_taken[self.current_player] = True
+        if all(self.actions_taken.values()):
+            self.end_battle_phase()
+
     def handle_combat(self, attacker: Piece, defender: Piece):
         """Handle combat between two pieces"""
         # Attacker deals damage to defender
         defender.take_damage(attacker.attack)
-        combat_msg = f"{attacker.color.value.title()} {attacker.piece_type.value.title()} attacks {defender.color.value.title()} {defender.piece_type.value.title()} for {attacker.attack} damage"
+        combat_msg = f"{COLOR_NAMES[attacker.color]} {PIECE_NAMES[attacker.piece_type]} attacks {COLOR_NAMES[defender.color]} {PIECE_NAMES[defender.piece_type]} for {attacker.attack} damage"
         self.add_to_log(combat_msg)
         
         # Check if defender is destroyed
         if not defender.is_alive():
-            death_msg = f"{defender.color.value.title()} {defender.piece_type.value.title()} is destroyed!"
+            death_msg = f"{COLOR_NAMES[defender.color]} {PIECE_NAMES[defender.piece_type]} is destroyed!"
             self.add_to_log(death_msg)
         else:
-            hp_msg = f"{defender.color.value.title()} {defender.piece_type.value.title()} has {defender.hp}/{defender.max_hp} HP remaining"
+            hp_msg = f"{COLOR_NAMES[defender.color]} {PIECE_NAMES[defender.piece_type]} has {defender.hp}/{defender.max_hp} HP remaining"
             self.add_to_log(hp_msg)
     
     def switch_player(self):
         """Switch to the other player"""
         self.current_player = Color.BLACK if self.current_player == Color.WHITE else Color.WHITE
-        turn_msg = f"{self.current_player.value.title()}'s turn"
+        turn_msg = f"{COLOR_NAMES[self.current_player]}'s turn"
         self.add_to_log(turn_msg)
     
     def check_battle_end(self):
@@ -758,25 +1040,34 @@ class TFTGame:
             mode_msg = f"Switched to {self.action_mode.upper()} mode"
             self.add_to_log(mode_msg)
         
+    def update(self):
+        """Advance game logic that runs on a timer; call once per frame before draw()"""
+        # Animation duration: 600ms. Resolve as soon as it is complete so draw()
+        # never spends a frame re-rendering the finished pose
+        if self.combat_anim and pygame.time.get_ticks() - self.combat_anim["start_time"] >= COMBAT_ANIM_DURATION:
+            # After animation, apply combat logic and cleanup
+            attacker = self.combat_anim["attacker"]
+            defender = self.combat_anim["defender"]
+            self.handle_combat(attacker, defender)
+            # Remove dead pieces and give rewards
+            if not defender.is_alive():
+                row, col = self.combat_anim["defender_pos"]
+                self.board.grid[row][col] = None
+                self.board_changed()
+                self.handle_piece_death(defender, attacker.color)
+            self.deselect_piece()
+            self.switch_player()
+            self.check_battle_end()
+            self.combat_anim = None
+
     def draw(self, screen: pygame.Surface):
         """Draw the complete TFT game"""
-        # Clear screen
-        screen.fill((15, 20, 35))
-        
-        # Draw board without background image
-        self.draw_simple_board(screen)
+        # Clear screen with the static UI layer (background, board squares and panel chrome)
+        screen.blit(self.get_static_ui_layer(screen), (0, 0))
         
         # Draw highlights during battle and setup phases
         if self.phase in [GamePhase.BATTLE, GamePhase.SETUP] and self.selected_piece:
-            self.board.highlight_cell(screen, self.selected_row, self.selected_col, (255, 255, 0))
-            
-            # Highlight valid moves and attack targets based on current mode
-            if self.action_mode == "move":
-                self.board.highlight_moves(screen, self.valid_moves)  # Green for moves
-            elif self.action_mode == "attack":
-                # Red for attack targets
-                for row, col in self.attack_targets:
-                    self.board.highlight_cell(screen, row, col, (255, 100, 100))
+            screen.blit(self.get_highlight_overlay(), self.board.board_rect.topleft)
         
         # Draw pieces with custom rendering using loaded images
         self.draw_pieces_with_images(screen)
@@ -784,45 +1075,25 @@ class TFTGame:
         # Draw hover window for piece info
         # (Removed duplicate rendering; now only drawn at the end of draw())
 
-        # Combat animation rendering
+        # Combat animation rendering (resolved in update())
         if self.combat_anim:
             self.draw_combat_animation(screen, self.combat_anim)
-            # Animation duration: 600ms
-            elapsed = pygame.time.get_ticks() - self.combat_anim["start_time"]
-            if elapsed > 600:
-                # After animation, apply combat logic and cleanup
-                attacker = self.combat_anim["attacker"]
-                defender = self.combat_anim["defender"]
-                self.handle_combat(attacker, defender)
-                # Remove dead pieces and give rewards
-                if not defender.is_alive():
-                    row, col = self.combat_anim["defender_pos"]
-                    self.board.grid[row][col] = None
-                    self.handle_piece_death(defender, attacker.color)
-                self.deselect_piece()
-                self.switch_player()
-                self.check_battle_end()
-                self.combat_anim = None
+
+        # Keep panel chrome above highlights and pieces where it overlaps the board
+        for rect in self.board_panel_overlaps:
+            screen.blit(self.static_ui_layer, rect, rect)
 
         # Draw dragging piece at mouse position if dragging from reserve
         if self.dragging_piece and self.dragging_from_reserve:
-            sprite = self.piece_sprites.get(self.dragging_piece.piece_type)
-            if sprite:
-                piece_size = self.board.cell_size - 10
-                scaled_sprite = pygame.transform.scale(sprite, (piece_size, piece_size))
-                if self.dragging_piece.color == Color.BLACK:
-                    tinted_sprite = scaled_sprite.copy()
-                    dark_overlay = pygame.Surface((piece_size, piece_size))
-                    dark_overlay.set_alpha(100)
-                    dark_overlay.fill((100, 50, 50))
-                    tinted_sprite.blit(dark_overlay, (0, 0))
-                    scaled_sprite = tinted_sprite
+            piece_size = self.board.cell_size - 10
+            tint_alpha = 100 if self.dragging_piece.color == Color.BLACK else 0
+            scaled_sprite = self.get_scaled_sprite(self.dragging_piece.piece_type, piece_size, tint_alpha)
+            if scaled_sprite:
                 screen.blit(scaled_sprite, (self.drag_offset_x - piece_size // 2, self.drag_offset_y - piece_size // 2))
             else:
                 symbol = self.get_piece_symbol(self.dragging_piece.piece_type)
-                font = pygame.font.Font(None, 36)
                 text_color = (255, 255, 255) if self.dragging_piece.color == Color.WHITE else (150, 50, 50)
-                text = font.render(symbol, True, text_color)
+                text = render_piece_symbol(symbol, text_color)
                 text_rect = text.get_rect(center=(self.drag_offset_x, self.drag_offset_y))
                 screen.blit(text, text_rect)
         
@@ -832,123 +1103,144 @@ class TFTGame:
         # Draw battle mode feedback
         if self.phase == GamePhase.BATTLE:
             banner_rect = pygame.Rect(0, 0, self.screen_width, 38)
-            pygame.draw.rect(screen, (255, 80, 80), banner_rect)
-            banner_text = self.title_font.render("⚔️ BATTLE MODE ⚔️", True, (255, 255, 255))
-            screen.blit(banner_text, (self.screen_width // 2 - banner_text.get_width() // 2, 4))
+            screen.fill((255, 80, 80), banner_rect)
+            banner_text, banner_width, _ = self.render_cached_sized(self.title_font, "⚔️ BATTLE MODE ⚔️", (255, 255, 255))
+            screen.blit(banner_text, (self.screen_width // 2 - banner_width // 2, 4))
 
         # --- Draw hover window for piece info (always on top) ---
+        self.draw_hover_window(screen)
+
+    def draw_hover_window(self, screen):
+        """Draw the info window for the piece or shop item under the mouse"""
         mouse_x, mouse_y = pygame.mouse.get_pos()
-        # Board hover
-        hovered_piece = None
-        for row in range(8):
-            for col in range(8):
-                piece = self.board.grid[row][col]
-                if piece and piece.is_alive():
-                    px = self.board.board_offset_x + col * self.board.cell_size
-                    py = self.board.board_offset_y + row * self.board.cell_size
-                    rect = pygame.Rect(px, py, self.board.cell_size, self.board.cell_size)
-                    if rect.collidepoint(mouse_x, mouse_y):
-                        hovered_piece = piece
-                        break
-            if hovered_piece:
-                break
+        # Board hover - the board is a uniform grid, so index it directly
+        cell = self.board.get_cell_at(mouse_x, mouse_y)
+        hovered_piece = self.board.grid[cell[0]][cell[1]] if cell else None
+        if hovered_piece and not hovered_piece.is_alive():
+            hovered_piece = None
         # Shop hover
         hovered_shop_piece = None
         if self.shop_open:
-            shop_width = self.shop_area.width
-            shop_height = self.shop_area.height
-            white_shop_rect = pygame.Rect(self.shop_area.x - shop_width - 30, self.shop_area.y, shop_width, shop_height)
-            black_shop_rect = pygame.Rect(self.shop_area.x, self.shop_area.y, shop_width, shop_height)
-            # White shop hover
-            for i in range(len(self.white_shop_items)):
-                x = white_shop_rect.x + 12
-                y = white_shop_rect.y + 48 + i * 65
-                item_width, item_height = shop_width - 24, 56
-                rect = pygame.Rect(x, y, item_width, item_height)
-                if rect.collidepoint(mouse_x, mouse_y):
-                    hovered_shop_piece = self.white_shop_items[i]
-                    break
-            # Black shop hover (takes priority if both overlap)
-            for i in range(len(self.black_shop_items)):
-                x = black_shop_rect.x + 12
-                y = black_shop_rect.y + 48 + i * 65
-                item_width, item_height = shop_width - 24, 56
-                rect = pygame.Rect(x, y, item_width, item_height)
-                if rect.collidepoint(mouse_x, mouse_y):
-                    hovered_shop_piece = self.black_shop_items[i]
-                    break
+            # Black shop takes priority if both overlap
+            hovered_shop_piece = (self.get_hovered_shop_item(self.black_shop_item_rects, self.black_shop_items, mouse_x, mouse_y)
+                                  or self.get_hovered_shop_item(self.white_shop_item_rects, self.white_shop_items, mouse_x, mouse_y))
         # Draw hover window (shop takes priority)
-        info_width, info_height = 180, 110
-        info_x = min(max(mouse_x + 20, 10), self.screen_width - info_width - 10)
-        info_y = min(max(mouse_y + 20, 10), self.screen_height - info_height - 10)
         if hovered_shop_piece:
             item = hovered_shop_piece
-            info_rect = pygame.Rect(info_x, info_y, info_width, info_height)
-            pygame.draw.rect(screen, (30, 30, 50), info_rect)
-            pygame.draw.rect(screen, (100, 255, 180), info_rect, 2)
-            font = pygame.font.Font("Hackathon_image/pixel_font.ttf", 22)
-            if isinstance(item, Card):
+            if item.kind == "card":
                 title = item.name
                 cost = f"Cost: {item.cost}"
                 card_type = "Immediate" if item.immediate else "Stored"
-                effectDict = {CardType.ARROW_VOLLEY: "Arrow Volley: -1 HP all units", 
-                              CardType.DISARM: "Disarm: Set attack=0", 
-                              CardType.REDEMPTION: "Redemption: black tiles take 1 dmg; white tiles gain 1 health", 
-                              CardType.LIGHTNING: "Lightning: 3 dmg to five random tiles on board",
-                              CardType.TOWER: "Gain 2 rooks that cannot move."}
-                effect = effectDict[item.card_type]
-                lines = [title, cost, f"Type: {card_type}", effect, "Shop Card"]
+                effect = CARD_EFFECT_TEXT[item.card_type]
+                lines = (title, cost, f"Type: {card_type}", effect, "Shop Card")
             else:
-                title = f"{item.piece_type.value.title()[:12]}"
+                title = f"{PIECE_NAMES[item.piece_type][:12]}"
                 hp = f"HP: {item.hp}/{item.max_hp}"
                 atk = f"ATK: {item.attack}"
                 cost = f"Cost: {item.cost}"
                 pos = "Shop Item"
-                lines = [title, hp, atk, cost, pos]
-            for i, line in enumerate(lines):
-                text = font.render(line[:22], True, (255, 255, 255))
-                screen.blit(text, (info_x + 12, info_y + 12 + i * 20))
+                lines = (title, hp, atk, cost, pos)
         elif hovered_piece:
             piece = hovered_piece
-            info_rect = pygame.Rect(info_x, info_y, info_width, info_height)
-            pygame.draw.rect(screen, (30, 30, 50), info_rect)
-            pygame.draw.rect(screen, (100, 255, 180), info_rect, 2)
-            font = pygame.font.Font("Hackathon_image/pixel_font.ttf", 22)
-            title = f"{piece.color.value.title()} {piece.piece_type.value.title()}"
+            title = f"{COLOR_NAMES[piece.color]} {PIECE_NAMES[piece.piece_type]}"
             hp = f"HP: {piece.hp}/{piece.max_hp}"
             atk = f"ATK: {piece.attack}"
             cost = f"Cost: {piece.cost}"
             pos = f"Pos: {chr(ord('a')+piece.col)}{8-piece.row}"
-            lines = [title, hp, atk, cost, pos]
-            for i, line in enumerate(lines):
-                text = font.render(line[:22], True, (255, 255, 255))
-                screen.blit(text, (info_x + 12, info_y + 12 + i * 20))
-        
+            lines = (title, hp, atk, cost, pos)
+        else:
+            return
+        info_width, info_height = 180, 110
+        info_x = min(max(mouse_x + 20, 10), self.screen_width - info_width - 10)
+        info_y = min(max(mouse_y + 20, 10), self.screen_height - info_height - 10)
+        # The window only changes when its text does, so reuse it while the
+        # mouse idles over the same piece
+        if lines != self.hover_cache_lines:
+            self.hover_cache_lines = lines
+            self.hover_cache_surface = self.build_hover_surface(lines, info_width, info_height)
+        screen.blit(self.hover_cache_surface, (info_x, info_y))
+
+    def build_hover_surface(self, lines: tuple, info_width: int, info_height: int) -> pygame.Surface:
+        """Render the hover window; sized to fit text that runs past the frame"""
+        texts = [self.render_cached(self.small_font, line[:22], (255, 255, 255)) for line in lines]
+        width = max([info_width] + [12 + text.get_width() for text in texts])
+        height = max([info_height] + [12 + i * 20 + text.get_height() for i, text in enumerate(texts)])
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        info_rect = pygame.Rect(0, 0, info_width, info_height)
+        surface.fill((30, 30, 50), info_rect)
+        pygame.draw.rect(surface, (100, 255, 180), info_rect, 2)
+        surface.blits([(text, (12, 12 + i * 20)) for i, text in enumerate(texts)], doreturn=False)
+        return surface
+
+    def get_hovered_shop_item(self, item_rects: Tuple[pygame.Rect, ...], items: list, mouse_x: int, mouse_y: int):
+        """Shop item whose drawn box is under the mouse"""
+        for rect, item in zip(item_rects, items):
+            if rect.collidepoint(mouse_x, mouse_y):
+                return item
+        return None
+
+    def get_highlight_overlay(self) -> pygame.Surface:
+        """Selection, move and attack highlights, re-rendered only when the selection changes"""
+        if self.action_mode == "move":
+            targets = self.valid_move_cells
+        elif self.action_mode == "attack":
+            targets = self.attack_target_cells
+        else:
+            targets = frozenset()
+        # The cell sets come from moves_cache, so re-selecting a piece on an
+        # unchanged board reuses the same frozensets and the key check is
+        # usually an identity comparison; a new board builds new sets, which
+        # compare by value
+        key = (self.selected_row, self.selected_col, self.action_mode, targets)
+        if key != self.highlight_key:
+            self.highlight_key = key
+            # Yellow for the selected piece, green for moves, red for attack targets
+            target_color = (0, 255, 0) if self.action_mode == "move" else (255, 100, 100)
+            cells = [(self.selected_row, self.selected_col, (255, 255, 0))]
+            cells += [(row, col, target_color) for row, col in targets]
+            self.highlight_overlay = self.board.render_highlights(cells)
+        return self.highlight_overlay
+
+    def get_static_ui_layer(self, screen: pygame.Surface) -> pygame.Surface:
+        """Background, board and panel chrome, re-rendered only when the shop opens/closes or the round changes"""
+        key = (screen.get_size(), self.shop_open, self.round_number)
+        if key != self.static_ui_key:
+            self.static_ui_key = key
+            self.static_ui_layer = self.build_static_ui_layer(screen.get_size())
+        return self.static_ui_layer
+
+    def build_static_ui_layer(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Render everything in the UI panels that does not change from frame to frame"""
+        layer = pygame.Surface(size)
+        layer.fill((15, 20, 35))
+        self.draw_simple_board(layer)
+        economy_rect = self.draw_economy_panel_static(layer)
+        self.draw_reserve_area_static(layer, self.white_reserve_area, Color.WHITE)
+        self.draw_reserve_area_static(layer, self.black_reserve_area, Color.BLACK)
+        if self.shop_open:
+            self.draw_shop_panel_static(layer, self.white_shop_area, "WHITE SHOP")
+            self.draw_shop_panel_static(layer, self.shop_area, "BLACK SHOP")
+        else:
+            self.draw_shop_closed(layer)
+        self.draw_battle_log_static(layer)
+        # Panels drew over the pieces too, so draw() re-blits the parts of the
+        # layer where a panel overlaps the board cells after drawing them
+        panel_rects = (economy_rect, self.white_reserve_area, self.black_reserve_area,
+                       self.white_shop_area, self.shop_area, self.battle_log_area)
+        board_rect = self.board.board_rect
+        self.board_panel_overlaps = [rect.clip(board_rect) for rect in panel_rects if rect.colliderect(board_rect)]
+        return layer
+
     def draw_tft_ui(self, screen: pygame.Surface):
         """Draw TFT-specific UI elements"""
-        # Draw title
-        title_text = f"🏰 TFT Chess Battle - Round {self.round_number} 🏰"
-        title_surface = self.title_font.render(title_text, True, (255, 215, 100))
-        title_x = screen.get_width() // 2 - title_surface.get_width() // 2 - 200
-        screen.blit(title_surface, (title_x, 10))
-        
-        # Draw phase and turn indicator
-        phase_text = f"Phase: {self.phase.value.upper()}"
-        phase_surface = self.font.render(phase_text, True, (200, 200, 255))
-        screen.blit(phase_surface, (50, 40))
-        
-        # Draw current player turn
-        turn_color = (255, 255, 100) if self.current_player == Color.WHITE else (255, 150, 150)
-        turn_text = f"Turn: {self.current_player.value.upper()}"
-        turn_surface = self.font.render(turn_text, True, turn_color)
-        screen.blit(turn_surface, (50, 80))
-        
-        # Draw action mode if piece is selected
-        if self.selected_piece:
-            mode_color = (100, 255, 100) if self.action_mode == "move" else (255, 100, 100)
-            mode_text = f"Mode: {self.action_mode.upper()}"
-            mode_surface = self.font.render(mode_text, True, mode_color)
-            screen.blit(mode_surface, (350, 60))
+        # Title, phase, turn and mode text only change between turns, so their
+        # strings are formatted and looked up once per change
+        mode = self.action_mode if self.selected_piece else None
+        key = (screen.get_width(), self.round_number, self.phase, self.current_player, mode)
+        if key != self.header_blits_key:
+            self.header_blits = self.build_header_blits(screen.get_width(), mode)
+            self.header_blits_key = key
+        blit_batch(screen, self.header_blits)
         
         # Draw detailed economic system UI
         self.draw_economy_panel(screen)
@@ -957,17 +1249,43 @@ class TFTGame:
         self.draw_reserve_area(screen, self.white_reserve_area, self.white_reserve, Color.WHITE)
         self.draw_reserve_area(screen, self.black_reserve_area, self.black_reserve, Color.BLACK)
         
-        # Draw shop
+        # Draw shop (the closed shop lives entirely in the static layer)
         if self.shop_open:
             self.draw_shop(screen)
-        else:
-            self.draw_shop_closed(screen)
             
         # Draw battle log (smaller)
         self.draw_battle_log(screen)
         
-    def draw_economy_panel(self, screen: pygame.Surface):
-        """Draw detailed economic system information"""
+    def build_header_blits(self, screen_width: int, mode: Optional[str]) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """(surface, position) blits for the title, phase, turn and action mode"""
+        # Draw title
+        title_text = f"🏰 TFT Chess Battle - Round {self.round_number} 🏰"
+        title_surface, title_width, _ = self.render_cached_sized(self.title_font, title_text, (255, 215, 100))
+        title_x = screen_width // 2 - title_width // 2 - 200
+        
+        # Draw phase and turn indicator
+        phase_text = f"Phase: {self.phase.value.upper()}"
+        phase_surface = self.render_cached(self.font, phase_text, (200, 200, 255))
+        
+        # Draw current player turn
+        turn_color = (255, 255, 100) if self.current_player == Color.WHITE else (255, 150, 150)
+        turn_text = f"Turn: {self.current_player.value.upper()}"
+        turn_surface = self.render_cached(self.font, turn_text, turn_color)
+        
+        blits = [
+            (title_surface, (title_x, 10)),
+            (phase_surface, (50, 40)),
+            (turn_surface, (50, 80)),
+        ]
+        # Draw action mode if piece is selected
+        if mode:
+            mode_color = (100, 255, 100) if mode == "move" else (255, 100, 100)
+            mode_text = f"Mode: {mode.upper()}"
+            blits.append((self.render_cached(self.font, mode_text, mode_color), (350, 60)))
+        return blits
+
+    def draw_economy_panel_static(self, screen: pygame.Surface) -> pygame.Rect:
+        """Draw the economy panel background, title and income rules; returns the panel rect"""
         # Economy panel positioning - dynamic
         panel_width = int(self.screen_width * 0.25)
         panel_height = int(self.screen_height * 0.13)
@@ -976,72 +1294,110 @@ class TFTGame:
         
         # Draw economy panel background
         economy_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        pygame.draw.rect(screen, (30, 40, 60), economy_rect)
+        screen.fill((30, 40, 60), economy_rect)
         pygame.draw.rect(screen, (100, 120, 150), economy_rect, 2)
         
         # Title
         title_text = "💰 ECONOMY SYSTEM"
-        title_surface = self.font.render(title_text, True, (255, 215, 100))
+        title_surface = self.render_cached(self.font, title_text, (255, 215, 100))
         screen.blit(title_surface, (panel_x + 10, panel_y + 5))
+
+        # Economic info
+        eco_y = panel_y + 75
+        income_text = f"Round Income: +1 🪙 | Kill Reward: +½ cost"
+        income_surface = self.render_cached(self.small_font, income_text, (150, 200, 150))
+        screen.blit(income_surface, (panel_x + 10, eco_y))
+        return economy_rect
+
+    def draw_economy_panel(self, screen: pygame.Surface):
+        """Draw detailed economic system information"""
+        # The rows only change on a purchase, deploy or payout, so their blits
+        # are rebuilt on those transitions and replayed otherwise
+        key = (self.white_coins, len(self.white_reserve), self.white_army_value,
+               self.black_coins, len(self.black_reserve), self.black_army_value)
+        if key != self.economy_blits_key:
+            self.economy_blits = self.build_economy_blits()
+            self.economy_blits_key = key
+        blit_batch(screen, self.economy_blits)
+
+    def build_economy_blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """(surface, position) blits for the white and black economy rows"""
+        panel_x = self.screen_width - int(self.screen_width * 0.25) - 40
+        panel_y = 20
         
         # White player economics
         white_y = panel_y + 30
         white_coins_text = f"White: {self.white_coins} 🪙"
         white_reserve_text = f"Reserve: {len(self.white_reserve)}/8"
-        white_army_value = sum(self.get_piece_cost(p.piece_type) for p in self.white_reserve)
-        white_value_text = f"Army Value: {white_army_value} 🪙"
-        
-        white_coins_surface = self.small_font.render(white_coins_text, True, (255, 255, 255))
-        white_reserve_surface = self.small_font.render(white_reserve_text, True, (200, 200, 200))
-        white_value_surface = self.small_font.render(white_value_text, True, (180, 180, 180))
+        white_value_text = f"Army Value: {self.white_army_value} 🪙"
         
-        screen.blit(white_coins_surface, (panel_x + 10, white_y))
-        screen.blit(white_reserve_surface, (panel_x + 120, white_y))
-        screen.blit(white_value_surface, (panel_x + 280, white_y))
+        white_coins_surface = self.render_cached(self.small_font, white_coins_text, (255, 255, 255))
+        white_reserve_surface = self.render_cached(self.small_font, white_reserve_text, (200, 200, 200))
+        white_value_surface = self.render_cached(self.small_font, white_value_text, (180, 180, 180))
         
         # Black player economics
         black_y = panel_y + 50
         black_coins_text = f"Black: {self.black_coins} 🪙"
         black_reserve_text = f"Reserve: {len(self.black_reserve)}/8"
-        black_army_value = sum(self.get_piece_cost(p.piece_type) for p in self.black_reserve)
-        black_value_text = f"Army Value: {black_army_value} 🪙"
-        
-        black_coins_surface = self.small_font.render(black_coins_text, True, (255, 150, 150))
-        black_reserve_surface = self.small_font.render(black_reserve_text, True, (200, 150, 150))
-        black_value_surface = self.small_font.render(black_value_text, True, (180, 150, 150))
-        
-        screen.blit(black_coins_surface, (panel_x + 10, black_y))
-        screen.blit(black_reserve_surface, (panel_x + 120, black_y))
-        screen.blit(black_value_surface, (panel_x + 280, black_y))
-        
-        # Economic info
-        eco_y = panel_y + 75
-        income_text = f"Round Income: +1 🪙 | Kill Reward: +½ cost"
-        income_surface = self.small_font.render(income_text, True, (150, 200, 150))
-        screen.blit(income_surface, (panel_x + 10, eco_y))
-        
-    def draw_reserve_area(self, screen: pygame.Surface, area: pygame.Rect, reserve: List[Piece], player: Color):
-        """Draw reserve area in retro pixel-art style"""
+        black_value_text = f"Army Value: {self.black_army_value} 🪙"
+        
+        black_coins_surface = self.render_cached(self.small_font, black_coins_text, (255, 150, 150))
+        black_reserve_surface = self.render_cached(self.small_font, black_reserve_text, (200, 150, 150))
+        black_value_surface = self.render_cached(self.small_font, black_value_text, (180, 150, 150))
+        
+        return [
+            (white_coins_surface, (panel_x + 10, white_y)),
+            (white_reserve_surface, (panel_x + 120, white_y)),
+            (white_value_surface, (panel_x + 280, white_y)),
+            (black_coins_surface, (panel_x + 10, black_y)),
+            (black_reserve_surface, (panel_x + 120, black_y)),
+            (black_value_surface, (panel_x + 280, black_y)),
+        ]
+        
+    def draw_reserve_area_static(self, screen: pygame.Surface, area: pygame.Rect, player: Color):
+        """Draw reserve panel, label and empty slot frames in retro pixel-art style"""
         # Draw background panel with pixel border
-        pygame.draw.rect(screen, self.palette["panel"], area)
+        screen.fill(self.palette["panel"], area)
         pygame.draw.rect(screen, self.palette["border"], area, 4)
         pixel_size = 10
-        pygame.draw.rect(screen, self.palette["border"], (area.x, area.y, pixel_size, pixel_size))
-        pygame.draw.rect(screen, self.palette["border"], (area.x + area.width - pixel_size, area.y, pixel_size, pixel_size))
-        pygame.draw.rect(screen, self.palette["border"], (area.x, area.y + area.height - pixel_size, pixel_size, pixel_size))
-        pygame.draw.rect(screen, self.palette["border"], (area.x + area.width - pixel_size, area.y + area.height - pixel_size, pixel_size, pixel_size))
+        screen.fill(self.palette["border"], (area.x, area.y, pixel_size, pixel_size))
+        screen.fill(self.palette["border"], (area.x + area.width - pixel_size, area.y, pixel_size, pixel_size))
+        screen.fill(self.palette["border"], (area.x, area.y + area.height - pixel_size, pixel_size, pixel_size))
+        screen.fill(self.palette["border"], (area.x + area.width - pixel_size, area.y + area.height - pixel_size, pixel_size, pixel_size))
 
         # Draw label in pixel font
         label = f"{player.value.upper()} RESERVE"
-        label_surface = self.font.render(label, True, self.palette["neon_cyan"])
+        label_surface = self.render_cached(self.font, label, self.palette["neon_cyan"])
         screen.blit(label_surface, (area.x + 8, area.y + 8))
 
         # Draw reserve slots as pixel frames
         pieces_per_row = 3
         max_slots = 8
+        screen.blits([(self.reserve_slot_frame, (area.x + 12 + (i % pieces_per_row) * 55, area.y + 32 + (i // pieces_per_row) * 60))
+                      for i in range(max_slots)], doreturn=False)
+
+    def draw_reserve_area(self, screen: pygame.Surface, area: pygame.Rect, reserve: List[Piece], player: Color):
+        """Draw reserve pieces, HP bars and flickering empty slots over the static frames"""
+        flicker = (pygame.time.get_ticks() // 200) % 2 == 0
+        # Skip the slot layout while nothing shown in the reserve has changed
+        key = (tuple((piece.piece_type, piece.color, piece.hp, piece.max_hp) for piece in reserve), flicker)
+        cached = self.reserve_blits.get(player)
+        if cached is None or cached[0] != key:
+            cached = (key, *self.build_reserve_blits(area, reserve, flicker))
+            self.reserve_blits[player] = cached
+        _, sprite_blits, hp_bars = cached
+        # Slots never overlap, so sprites and labels go out in one batch after the frames
+        blit_batch(screen, sprite_blits)
+        # HP bars overlap the bottom of the sprite, so draw them last
+        blit_batch(screen, hp_bars)
+
+    def build_reserve_blits(self, area: pygame.Rect, reserve: List[Piece], flicker: bool):
+        """(sprite and label blits, HP bar blits) for one reserve panel"""
+        pieces_per_row = 3
+        max_slots = 8
         slot_width, slot_height = 50, 55
-        time_ms = pygame.time.get_ticks()
-        flicker = (time_ms // 200) % 2 == 0
+        sprite_blits = []
+        hp_bars = []
 
         for i in range(max_slots):
             col = i % pieces_per_row
@@ -1049,225 +1405,128 @@ class TFTGame:
             x = area.x + 12 + col * 55
             y = area.y + 32 + row * 60
 
-            # Draw pixel frame for slot
-            pygame.draw.rect(screen, self.palette["bg"], (x, y, slot_width, slot_height))
-            pygame.draw.rect(screen, self.palette["border"], (x, y, slot_width, slot_height), 3)
-            # Pixel corners
-            pygame.draw.rect(screen, self.palette["border"], (x, y, 7, 7))
-            pygame.draw.rect(screen, self.palette["border"], (x + slot_width - 7, y, 7, 7))
-            pygame.draw.rect(screen, self.palette["border"], (x, y + slot_height - 7, 7, 7))
-            pygame.draw.rect(screen, self.palette["border"], (x + slot_width - 7, y + slot_height - 7, 7, 7))
-
             if i < len(reserve):
                 piece = reserve[i]
                 # Piece sprite
-                sprite = self.piece_sprites.get(piece.piece_type)
-                if sprite:
-                    sprite_size = min(slot_width - 12, slot_height - 12)
-                    small_sprite = pygame.transform.scale(sprite, (sprite_size, sprite_size))
-                    if piece.color == Color.BLACK:
-                        tinted = small_sprite.copy()
-                        overlay = pygame.Surface((sprite_size, sprite_size))
-                        overlay.set_alpha(80)
-                        overlay.fill((100, 50, 50))
-                        tinted.blit(overlay, (0, 0))
-                        small_sprite = tinted
+                sprite_size = min(slot_width - 12, slot_height - 12)
+                small_sprite = self.get_scaled_sprite(piece.piece_type, sprite_size, 80 if piece.color == Color.BLACK else 0)
+                if small_sprite:
                     sprite_x = x + (slot_width - sprite_size) // 2
                     sprite_y = y + (slot_height - sprite_size) // 2
-                    screen.blit(small_sprite, (sprite_x, sprite_y))
+                    sprite_blits.append((small_sprite, (sprite_x, sprite_y)))
                 else:
                     symbol = self.get_piece_symbol(piece.piece_type)
-                    symbol_surface = self.font.render(symbol, True, self.palette["white"])
-                    symbol_x = x + slot_width // 2 - symbol_surface.get_width() // 2
-                    symbol_y = y + slot_height // 2 - symbol_surface.get_height() // 2
-                    screen.blit(symbol_surface, (symbol_x, symbol_y))
+                    symbol_surface, symbol_width, symbol_height = self.render_cached_sized(self.font, symbol, self.palette["white"])
+                    symbol_x = x + slot_width // 2 - symbol_width // 2
+                    symbol_y = y + slot_height // 2 - symbol_height // 2
+                    sprite_blits.append((symbol_surface, (symbol_x, symbol_y)))
                 # Tiny pixel HP bar below sprite
                 hp_bar_y = y + slot_height - 12
                 hp_bar_x = x + 8
                 hp_bar_w = slot_width - 16
                 hp_ratio = piece.hp / piece.max_hp if piece.max_hp > 0 else 0
                 hp_fill = int(hp_bar_w * hp_ratio)
-                pygame.draw.rect(screen, self.palette["neon_red"], (hp_bar_x, hp_bar_y, hp_bar_w, 6))
-                pygame.draw.rect(screen, self.palette["neon_green"], (hp_bar_x, hp_bar_y, hp_fill, 6))
-                pygame.draw.rect(screen, self.palette["white"], (hp_bar_x, hp_bar_y, hp_bar_w, 6), 1)
-            else:
+                hp_bars.append((self.get_hp_bar(hp_bar_w, hp_fill, self.palette["neon_red"], self.palette["neon_green"]),
+                                (hp_bar_x, hp_bar_y)))
+            elif flicker:
                 # Empty slot: flickering "EMPTY" in pixel font (smaller)
-                if flicker:
-                    placeholder = "EMPTY"
-                    small_font = pygame.font.Font("Hackathon_image/pixel_font.ttf", 12)
-                    placeholder_surface = small_font.render(placeholder, True, self.palette["neon_yellow"])
-                    px = x + slot_width // 2 - placeholder_surface.get_width() // 2
-                    py = y + slot_height // 2 - placeholder_surface.get_height() // 2
-                    screen.blit(placeholder_surface, (px, py))
+                sprite_blits.append((self.empty_slot_label, (x + self.empty_slot_offset[0], y + self.empty_slot_offset[1])))
+        return sprite_blits, hp_bars
+
+    def shop_item_key(self, item):
+        """Cache key for an item's shop surface: its card type or piece type"""
+        return item.card_type if item.kind == "card" else item.piece_type
+
+    def get_shop_item_cost(self, item) -> int:
+        """Cost shown in the shop for a card or piece"""
+        return item.cost if item.kind == "card" else self.get_piece_cost(item.piece_type)
+
+    def build_shop_item_surface(self, item) -> pygame.Surface:
+        """Render the static part of a shop slot (frame, icon, name, cost) once"""
+        item_width, item_height = self.shop_area.width - 24, 56
+        blits = []
+        if item.kind == "card":
+            # Card UI
+            icon = self.card_icons.get(item.card_type)
+            if icon:
+                icon_size = min(item_height - 12, 32)
+                if icon.get_size() != (icon_size, icon_size):
+                    icon = pygame.transform.scale(icon, (icon_size, icon_size))
+                blits.append((icon, (12, (item_height - icon_size) // 2)))
+            name_text = item.name
+        else:
+            # Piece/consumable UI
+            sprite_size = min(item_height - 12, 32)
+            shop_sprite = self.get_scaled_sprite(item.piece_type, sprite_size)
+            if shop_sprite:
+                blits.append((shop_sprite, (12, (item_height - sprite_size) // 2)))
+            else:
+                symbol = self.get_piece_symbol(item.piece_type)
+                symbol_surface = self.font.render(symbol, True, self.palette["white"])
+                blits.append((symbol_surface, (12, (item_height - 32) // 2)))
+            name_text = item.piece_type.value.upper()
+        name_surface = self.font.render(name_text, True, self.palette["neon_cyan"])
+        blits.append((name_surface, (60, 8)))
+        cost_surface = self.font.render(f"{self.get_shop_item_cost(item)}", True, self.palette["neon_yellow"])
+        blits.append((cost_surface, (60, 28)))
+        # Coin icon
+        if self.coin_icon:
+            blits.append((self.coin_icon, (90, 28)))
+        # Immediate card icon
+        if item.kind == "card" and item.immediate:
+            flash_surface = self.font.render("⚡", True, (255, 255, 80))
+            blits.append((flash_surface, (item_width - 32, 8)))
+        # Long names may run past the slot frame, so size the surface to fit everything
+        bounds = pygame.Rect(0, 0, item_width, item_height).unionall([img.get_rect(topleft=pos) for img, pos in blits])
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        surface.fill(self.palette["bg"], (0, 0, item_width, item_height))
+        pygame.draw.rect(surface, self.palette["border"], (0, 0, item_width, item_height), 3)
+        surface.blits(blits, doreturn=False)
+        return surface
+
     def draw_shop(self, screen: pygame.Surface):
         """Draw white shop at far left and black shop at right"""
-        shop_width = self.shop_area.width
-        shop_height = self.shop_area.height
-        white_shop_rect = self.white_shop_area
-        black_shop_rect = self.shop_area
-
-        # Draw white shop
-        pygame.draw.rect(screen, self.palette["panel"], white_shop_rect)
-        pygame.draw.rect(screen, self.palette["border"], white_shop_rect, 4)
-        shop_title = "WHITE SHOP"
-        title_surface = self.title_font.render(shop_title, True, self.palette["neon_yellow"])
-        screen.blit(title_surface, (white_shop_rect.x + 18, white_shop_rect.y + 8))
-        for i, item in enumerate(self.white_shop_items):
-            x = white_shop_rect.x + 12
-            y = white_shop_rect.y + 48 + i * 65
-            item_width, item_height = shop_width - 24, 56
-            pygame.draw.rect(screen, self.palette["bg"], (x, y, item_width, item_height))
-            pygame.draw.rect(screen, self.palette["border"], (x, y, item_width, item_height), 3)
-            if isinstance(item, Card):
-                # Card UI
-                icon = self.card_icons.get(item.card_type)
-                if icon:
-                    icon_size = min(item_height - 12, 32)
-                    card_icon = pygame.transform.scale(icon, (icon_size, icon_size))
-                    screen.blit(card_icon, (x + 12, y + (item_height - icon_size) // 2))
-                name_surface = self.font.render(item.name, True, self.palette["neon_cyan"])
-                screen.blit(name_surface, (x + 60, y + 8))
-                cost_text = f"{item.cost}"
-                cost_surface = self.font.render(cost_text, True, self.palette["neon_yellow"])
-                screen.blit(cost_surface, (x + 60, y + 28))
-                # Coin icon
-                try:
-                    coin_img = pygame.image.load("Hackathon_image/coin.png")
-                    coin_img = pygame.transform.scale(coin_img, (18, 18))
-                    screen.blit(coin_img, (x + 90, y + 28))
-                except Exception:
-                    pass
-                # Immediate card icon
-                if item.immediate:
-                    flash_surface = self.font.render("⚡", True, (255, 255, 80))
-                    screen.blit(flash_surface, (x + item_width - 32, y + 8))
-                can_afford = self.white_coins >= item.cost
-            else:
-                # Piece/consumable UI
-                sprite = self.piece_sprites.get(item.piece_type)
-                if sprite:
-                    sprite_size = min(item_height - 12, 32)
-                    shop_sprite = pygame.transform.scale(sprite, (sprite_size, sprite_size))
-                    sprite_x = x + 12
-                    sprite_y = y + (item_height - sprite_size) // 2
-                    screen.blit(shop_sprite, (sprite_x, sprite_y))
-                else:
-                    symbol = self.get_piece_symbol(item.piece_type)
-                    symbol_surface = self.font.render(symbol, True, self.palette["white"])
-                    sprite_x = x + 12
-                    sprite_y = y + (item_height - 32) // 2
-                    screen.blit(symbol_surface, (sprite_x, sprite_y))
-                name_text = item.piece_type.value.upper()
-                name_surface = self.font.render(name_text, True, self.palette["neon_cyan"])
-                screen.blit(name_surface, (x + 60, y + 8))
-                cost = self.get_piece_cost(item.piece_type)
-                cost_text = f"{cost}"
-                cost_surface = self.font.render(cost_text, True, self.palette["neon_yellow"])
-                screen.blit(cost_surface, (x + 60, y + 28))
-                try:
-                    coin_img = pygame.image.load("Hackathon_image/coin.png")
-                    coin_img = pygame.transform.scale(coin_img, (18, 18))
-                    screen.blit(coin_img, (x + 90, y + 28))
-                except Exception:
-                    pass
-                can_afford = self.white_coins >= cost
-            if not can_afford:
-                try:
-                    red_overlay = pygame.image.load("Hackathon_image/red_overlay.png")
-                    red_overlay = pygame.transform.scale(red_overlay, (item_width, item_height))
-                    screen.blit(red_overlay, (x, y))
-                except Exception:
-                    overlay = pygame.Surface((item_width, item_height), pygame.SRCALPHA)
-                    overlay.fill((255, 0, 0, 120))
-                    screen.blit(overlay, (x, y))
-
-        # Draw black shop
-        pygame.draw.rect(screen, self.palette["panel"], black_shop_rect)
-        pygame.draw.rect(screen, self.palette["border"], black_shop_rect, 4)
-        shop_title = "BLACK SHOP"
-        title_surface = self.title_font.render(shop_title, True, self.palette["neon_yellow"])
-        screen.blit(title_surface, (black_shop_rect.x + 18, black_shop_rect.y + 8))
-        for i, item in enumerate(self.black_shop_items):
-            x = black_shop_rect.x + 12
-            y = black_shop_rect.y + 48 + i * 65
-            item_width, item_height = shop_width - 24, 56
-            pygame.draw.rect(screen, self.palette["bg"], (x, y, item_width, item_height))
-            pygame.draw.rect(screen, self.palette["border"], (x, y, item_width, item_height), 3)
-            if isinstance(item, Card):
-                # Card UI
-                icon = self.card_icons.get(item.card_type)
-                if icon:
-                    icon_size = min(item_height - 12, 32)
-                    card_icon = pygame.transform.scale(icon, (icon_size, icon_size))
-                    screen.blit(card_icon, (x + 12, y + (item_height - icon_size) // 2))
-                name_surface = self.font.render(item.name, True, self.palette["neon_cyan"])
-                screen.blit(name_surface, (x + 60, y + 8))
-                cost_text = f"{item.cost}"
-                cost_surface = self.font.render(cost_text, True, self.palette["neon_yellow"])
-                screen.blit(cost_surface, (x + 60, y + 28))
-                # Coin icon
-                try:
-                    coin_img = pygame.image.load("Hackathon_image/coin.png")
-                    coin_img = pygame.transform.scale(coin_img, (18, 18))
-                    screen.blit(coin_img, (x + 90, y + 28))
-                except Exception:
-                    pass
-                # Immediate card icon
-                if item.immediate:
-                    flash_surface = self.font.render("⚡", True, (255, 255, 80))
-                    screen.blit(flash_surface, (x + item_width - 32, y + 8))
-                can_afford = self.black_coins >= item.cost
-            else:
-                # Piece/consumable UI
-                sprite = self.piece_sprites.get(item.piece_type)
-                if sprite:
-                    sprite_size = min(item_height - 12, 32)
-                    shop_sprite = pygame.transform.scale(sprite, (sprite_size, sprite_size))
-                    sprite_x = x + 12
-                    sprite_y = y + (item_height - sprite_size) // 2
-                    screen.blit(shop_sprite, (sprite_x, sprite_y))
-                else:
-                    symbol = self.get_piece_symbol(item.piece_type)
-                    symbol_surface = self.font.render(symbol, True, self.palette["white"])
-                    sprite_x = x + 12
-                    sprite_y = y + (item_height - 32) // 2
-                    screen.blit(symbol_surface, (sprite_x, sprite_y))
-                name_text = item.piece_type.value.upper()
-                name_surface = self.font.render(name_text, True, self.palette["neon_cyan"])
-                screen.blit(name_surface, (x + 60, y + 8))
-                cost = self.get_piece_cost(item.piece_type)
-                cost_text = f"{cost}"
-                cost_surface = self.font.render(cost_text, True, self.palette["neon_yellow"])
-                screen.blit(cost_surface, (x + 60, y + 28))
-                try:
-                    coin_img = pygame.image.load("Hackathon_image/coin.png")
-                    coin_img = pygame.transform.scale(coin_img, (18, 18))
-                    screen.blit(coin_img, (x + 90, y + 28))
-                except Exception:
-                    pass
-                can_afford = self.black_coins >= cost
-            if not can_afford:
-                try:
-                    red_overlay = pygame.image.load("Hackathon_image/red_overlay.png")
-                    red_overlay = pygame.transform.scale(red_overlay, (item_width, item_height))
-                    screen.blit(red_overlay, (x, y))
-                except Exception:
-                    overlay = pygame.Surface((item_width, item_height), pygame.SRCALPHA)
-                    overlay.fill((255, 0, 0, 120))
-                    screen.blit(overlay, (x, y))
+        self.draw_shop_panel(screen, Color.WHITE, self.white_shop_item_rects, self.white_shop_items, self.white_coins)
+        self.draw_shop_panel(screen, Color.BLACK, self.black_shop_item_rects, self.black_shop_items, self.black_coins)
+
+    def draw_shop_panel_static(self, screen: pygame.Surface, shop_rect: pygame.Rect, shop_title: str):
+        """Draw one player's shop panel background and title"""
+        screen.fill(self.palette["panel"], shop_rect)
+        pygame.draw.rect(screen, self.palette["border"], shop_rect, 4)
+        title_surface = self.render_cached(self.title_font, shop_title, self.palette["neon_yellow"])
+        screen.blit(title_surface, (shop_rect.x + 18, shop_rect.y + 8))
+
+    def draw_shop_panel(self, screen: pygame.Surface, player: Color, item_rects: Tuple[pygame.Rect, ...], items: list, coins: int):
+        """Draw one player's shop items from the prebuilt item surfaces"""
+        # Items only change on a reroll or purchase and the overlays on a coin
+        # change; holding the items in the key also keeps their ids from being reused
+        key = (tuple(items), coins)
+        cached = self.shop_panel_blits.get(player)
+        if cached is None or cached[0] != key:
+            item_blits = []
+            overlay_blits = []
+            for rect, item in zip(item_rects, items):
+                item_blits.append((self.shop_item_surfaces[self.shop_item_key(item)], rect.topleft))
+                if coins < self.get_shop_item_cost(item):
+                    overlay_blits.append((self.unaffordable_overlay, rect.topleft))
+            cached = (key, item_blits, overlay_blits)
+            self.shop_panel_blits[player] = cached
+        _, item_blits, overlay_blits = cached
+        blit_batch(screen, item_blits)
+        blit_batch(screen, overlay_blits)
             
     def draw_shop_closed(self, screen: pygame.Surface):
         """Draw shop closed message for both shops"""
         # Black shop
-        pygame.draw.rect(screen, (40, 40, 50), self.shop_area)
+        screen.fill((40, 40, 50), self.shop_area)
         pygame.draw.rect(screen, (100, 100, 120), self.shop_area, 2)
         closed_text = "🔒 Shop Closed"
         next_open = 3 - (self.round_number % 3)
         if next_open == 3:
             next_open = 0
         info_text = f"Opens in {next_open} rounds"
-        closed_surface = self.font.render(closed_text, True, (150, 150, 150))
-        info_surface = self.small_font.render(info_text, True, (120, 120, 120))
+        closed_surface = self.render_cached(self.font, closed_text, (150, 150, 150))
+        info_surface = self.render_cached(self.small_font, info_text, (120, 120, 120))
         # Black shop
         closed_x = self.shop_area.x + self.shop_area.width // 2 - closed_surface.get_width() // 2
         info_x = self.shop_area.x + self.shop_area.width // 2 - info_surface.get_width() // 2
@@ -1276,7 +1535,7 @@ class TFTGame:
         screen.blit(closed_surface, (closed_x, closed_y))
         screen.blit(info_surface, (info_x, info_y))
         # White shop
-        pygame.draw.rect(screen, (40, 40, 50), self.white_shop_area)
+        screen.fill((40, 40, 50), self.white_shop_area)
         pygame.draw.rect(screen, (100, 100, 120), self.white_shop_area, 2)
         closed_x_w = self.white_shop_area.x + self.white_shop_area.width // 2 - closed_surface.get_width() // 2
         info_x_w = self.white_shop_area.x + self.white_shop_area.width // 2 - info_surface.get_width() // 2
@@ -1285,58 +1544,50 @@ class TFTGame:
         screen.blit(closed_surface, (closed_x_w, closed_y_w))
         screen.blit(info_surface, (info_x_w, info_y_w))
         
-    def draw_battle_log(self, screen: pygame.Surface):
-        """Draw battle log in retro terminal style with typewriter effect and color coding"""
-        log_width = int(self.screen_width * 0.45)
-        log_height = 100
-        log_x = (self.screen_width - log_width) // 2
-        log_y = self.screen_height - log_height - 20
-        log_area = pygame.Rect(log_x, log_y, log_width, log_height)
-        pygame.draw.rect(screen, self.palette["black"], log_area)
+    def draw_battle_log_static(self, screen: pygame.Surface):
+        """Draw the battle log frame and title in retro terminal style"""
+        log_area = self.battle_log_area
+        screen.fill(self.palette["black"], log_area)
         pygame.draw.rect(screen, self.palette["neon_green"], log_area, 3)
         pixel_size = 8
-        pygame.draw.rect(screen, self.palette["neon_green"], (log_area.x, log_area.y, pixel_size, pixel_size))
-        pygame.draw.rect(screen, self.palette["neon_green"], (log_area.x + log_area.width - pixel_size, log_area.y, pixel_size, pixel_size))
-        pygame.draw.rect(screen, self.palette["neon_green"], (log_area.x, log_area.y + log_area.height - pixel_size, pixel_size, pixel_size))
-        pygame.draw.rect(screen, self.palette["neon_green"], (log_area.x + log_area.width - pixel_size, log_area.y + log_area.height - pixel_size, pixel_size, pixel_size))
+        screen.fill(self.palette["neon_green"], (log_area.x, log_area.y, pixel_size, pixel_size))
+        screen.fill(self.palette["neon_green"], (log_area.x + log_area.width - pixel_size, log_area.y, pixel_size, pixel_size))
+        screen.fill(self.palette["neon_green"], (log_area.x, log_area.y + log_area.height - pixel_size, pixel_size, pixel_size))
+        screen.fill(self.palette["neon_green"], (log_area.x + log_area.width - pixel_size, log_area.y + log_area.height - pixel_size, pixel_size, pixel_size))
 
-        log_title = self.font.render("BATTLE LOG", True, self.palette["neon_green"])
+        log_title = self.render_cached(self.font, "BATTLE LOG", self.palette["neon_green"])
         screen.blit(log_title, (log_area.x + 8, log_area.y + 8))
 
-        # Typewriter effect for last message
-        messages = self.game_log[-3:]
+    def draw_battle_log(self, screen: pygame.Surface):
+        """Draw battle log messages with typewriter effect and color coding"""
+        if not self.game_log:
+            return
+        # Typewriter effect for last message; types out once, then stays whole
         typewriter_speed = 30  # ms per character
-        time_ms = pygame.time.get_ticks()
-        for i, message in enumerate(messages):
-            # Color code: red for damage, green for heals, yellow for gold
-            if "damage" in message or "attack" in message:
-                color = self.palette["neon_red"]
-            elif "heal" in message or "HP" in message:
-                color = self.palette["neon_green"]
-            elif "coin" in message or "gold" in message:
-                color = self.palette["neon_yellow"]
-            else:
-                color = self.palette["neon_green"]
-            # Typewriter effect for last message
-            if i == len(messages) - 1:
-                chars = min(len(message), (time_ms // typewriter_speed) % (len(message) + 1))
-                display_msg = message[:chars]
-            else:
-                display_msg = message
-            log_surface = self.font.render(display_msg, True, color)
-            screen.blit(log_surface, (log_area.x + 12, log_area.y + 32 + i * 22))
+        message, _, added_ms = self.game_log[-1]
+        chars = min(len(message), (pygame.time.get_ticks() - added_ms) // typewriter_speed)
+        # The lines only change when a message is logged or another character
+        # is typed, so idle frames replay the previous blits
+        key = (self.log_count, chars)
+        if key != self.log_blits_key:
+            self.log_blits = self.build_log_blits(chars)
+            self.log_blits_key = key
+        blit_batch(screen, self.log_blits)
+
+    def build_log_blits(self, chars: int) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """(surface, position) blits for the last three log messages, the newest cut to chars"""
+        log_area = self.battle_log_area
+        messages = list(self.game_log)[-3:]
+        blits = []
+        for i, (message, color, _) in enumerate(messages):
+            display_msg = message[:chars] if i == len(messages) - 1 else message
+            log_surface = self.render_cached(self.font, display_msg, color)
+            blits.append((log_surface, (log_area.x + 12, log_area.y + 32 + i * 22)))
+        return blits
             
     def get_piece_symbol(self, piece_type: PieceType) -> str:
         """Get symbol for piece type"""
-        symbols = {
-            PieceType.KING: '♔',
-            PieceType.QUEEN: '♕', 
-            PieceType.ROOK: '♖',
-            PieceType.BISHOP: '♗',
-            PieceType.KNIGHT: '♘',
-            PieceType.PAWN: '♙'
-        }
-        return symbols.get(piece_type, '?')
+        return PIECE_SYMBOLS.get(piece_type, '?')
     
     def draw_simple_board(self, screen: pygame.Surface):
         """Draw a simple chess board without background image"""
@@ -1346,9 +1597,7 @@ class TFTGame:
         for row in range(8):
             for col in range(8):
                 color = colors[(row + col) % 2]
-                x = self.board.board_offset_x + col * self.board.cell_size
-                y = self.board.board_offset_y + row * self.board.cell_size
-                pygame.draw.rect(screen, color, (x, y, self.board.cell_size, self.board.cell_size))
+                screen.fill(color, self.board.cell_rects[row][col])
         
         # Draw board border
         border_rect = pygame.Rect(
@@ -1361,7 +1610,6 @@ class TFTGame:
         
     def draw_pieces_with_images(self, screen: pygame.Surface):
         """Draw pieces using loaded images"""
-        import math
         time_ms = pygame.time.get_ticks()
 
         # Retro jump animation for selected piece (frame-step, not smooth)
@@ -1383,142 +1631,90 @@ class TFTGame:
 
         # Determine jump frame for selected piece
         selected_jump_frame = ((time_ms // 160) % 3)  # 3-frame cycle, 160ms per frame (slower float)
+        selected_jump = retro_jump_offset(selected_jump_frame)
 
-        for row in range(8):
-            for col in range(8):
-                piece = self.board.grid[row][col]
-                if piece is not None and piece.is_alive():
-                    # Skip attacker/defender during animation
-                    if piece is anim_attacker or piece is anim_defender:
-                        continue
-
-                    x = self.board.board_offset_x + col * self.board.cell_size
-                    y = self.board.board_offset_y + row * self.board.cell_size
-
-                    # Snap piece to grid, apply retro jump if selected
-                    is_selected = (
-                        self.selected_piece is piece
-                        and self.selected_row == row
-                        and self.selected_col == col
-                    )
-                    y_anim = y + retro_jump_offset(selected_jump_frame) if is_selected else y
-
-                    # Get the sprite for this piece type
-                    sprite = self.piece_sprites.get(piece.piece_type)
-
-                    if sprite:
-                        # Nearest-neighbor scaling for pixel art
-                        piece_size = self.board.cell_size - 10
-                        scaled_sprite = pygame.transform.scale(sprite, (piece_size, piece_size))
-                        # Apply color tint for different players
-                        if piece.color == Color.BLACK:
-                            tinted_sprite = scaled_sprite.copy()
-                            dark_overlay = pygame.Surface((piece_size, piece_size))
-                            dark_overlay.set_alpha(100)
-                            dark_overlay.fill((100, 50, 50))
-                            tinted_sprite.blit(dark_overlay, (0, 0))
-                            scaled_sprite = tinted_sprite
-                        screen.blit(scaled_sprite, (x + 5, y_anim + 5))
-                        # Draw piece border to distinguish colors better
-                        border_color = (255, 255, 255) if piece.color == Color.WHITE else (150, 50, 50)
-                        pygame.draw.rect(screen, border_color, (x + 3, y_anim + 3, piece_size + 4, piece_size + 4), 2)
-                    else:
-                        # Fallback to text rendering if image not available
-                        symbol = self.get_piece_symbol(piece.piece_type)
-                        font = pygame.font.Font(None, 36)
-                        text_color = (255, 255, 255) if piece.color == Color.WHITE else (150, 50, 50)
-                        text = font.render(symbol, True, text_color)
-                        text_rect = text.get_rect(center=(x + self.board.cell_size // 2, y_anim + self.board.cell_size // 2))
-                        screen.blit(text, text_rect)
-
-                    # Draw HP bar above piece if damaged
-                    if piece.hp < piece.max_hp:
-                        bar_width = self.board.cell_size - 20
-                        bar_height = 6
-                        bar_x = x + 10
-                        bar_y = y_anim - 10
-                        pygame.draw.rect(screen, (200, 50, 50), (bar_x, bar_y, bar_width, bar_height))
-                        health_ratio = piece.hp / piece.max_hp
-                        health_width = int(bar_width * health_ratio)
-                        pygame.draw.rect(screen, (50, 200, 50), (bar_x, bar_y, health_width, bar_height))
-                        pygame.draw.rect(screen, (255, 255, 255), (bar_x, bar_y, bar_width, bar_height), 1)
+        # Frame-constant values, bound once outside the piece loop
+        col_x = self.board.col_x
+        row_y = self.board.row_y
+        cell_size = self.board.cell_size
+        bar_width = cell_size - 20
+        selected_piece = self.selected_piece
+
+        # Collect sprites and HP bars, then draw each layer in one pass
+        sprite_blits = []
+        hp_bars = []
+        # Occupied cells come from the cached piece list instead of a 64-cell scan;
+        # attacker/defender are skipped during an animation because
+        # draw_combat_animation draws them
+        live_pieces = [(row, col, piece)
+                       for row, col, piece in self.get_board_pieces()
+                       if piece.is_alive()
+                       and piece is not anim_attacker and piece is not anim_defender]
+        for row, col, piece in live_pieces:
+            x = col_x[col]
+            y = row_y[row]
+
+            # Snap piece to grid, apply retro jump if selected
+            is_selected = (
+                selected_piece is piece
+                and self.selected_row == row
+                and self.selected_col == col
+            )
+            y_anim = y + selected_jump if is_selected else y
+
+            # Scaled, tinted and bordered sprite for this piece (cached)
+            board_sprite = self.get_board_sprite(piece.piece_type, piece.color)
+
+            if board_sprite:
+                sprite_blits.append((board_sprite, (x + 3, y_anim + 3)))
+            else:
+                # Fallback to text rendering if image not available
+                symbol = self.get_piece_symbol(piece.piece_type)
+                text_color = (255, 255, 255) if piece.color == Color.WHITE else (150, 50, 50)
+                text = render_piece_symbol(symbol, text_color)
+                text_dx, text_dy = piece_symbol_offset(symbol, text_color, cell_size)
+                sprite_blits.append((text, (x + text_dx, y_anim + text_dy)))
+
+            # Draw HP bar above piece if damaged
+            if piece.hp < piece.max_hp:
+                health_ratio = piece.hp / piece.max_hp
+                hp_bars.append((self.get_hp_bar(bar_width, int(bar_width * health_ratio)), (x + 10, y_anim - 10)))
+
+        blit_batch(screen, sprite_blits)
+        blit_batch(screen, hp_bars)
 
     def draw_combat_animation(self, screen: pygame.Surface, anim: dict):
         """Draw modular combat animation for attacker and defender"""
-        import math
         attacker = anim["attacker"]
         defender = anim["defender"]
         attacker_row, attacker_col = anim["attacker_pos"]
         defender_row, defender_col = anim["defender_pos"]
         elapsed = pygame.time.get_ticks() - anim["start_time"]
-        duration = 600
 
         # Get positions
-        ax = self.board.board_offset_x + attacker_col * self.board.cell_size
-        ay = self.board.board_offset_y + attacker_row * self.board.cell_size
-        dx = self.board.board_offset_x + defender_col * self.board.cell_size
-        dy = self.board.board_offset_y + defender_row * self.board.cell_size
+        ax = self.board.col_x[attacker_col]
+        ay = self.board.row_y[attacker_row]
+        dx = self.board.col_x[defender_col]
+        dy = self.board.row_y[defender_row]
 
         # Animation: attacker moves toward defender, defender shakes
-        progress = min(elapsed / duration, 1.0)
+        frame = min(elapsed, COMBAT_ANIM_DURATION)
         # Ease-in/ease-out for smoother attack motion
-        ease = 0.5 - 0.5 * math.cos(math.pi * progress)
-        if attacker.piece_type == PieceType.KNIGHT:
-            # Knight: jump attack
-            jump = int(-18 * math.sin(math.pi * progress))
-            ax_anim = ax + int((dx - ax) * ease * 0.7)
-            ay_anim = ay + int((dy - ay) * ease * 0.7) + jump
-        elif attacker.piece_type == PieceType.ROOK:
-            # Rook: slide attack
-            ax_anim = ax + int((dx - ax) * ease * 0.8)
-            ay_anim = ay + int((dy - ay) * ease * 0.8)
-        elif attacker.piece_type == PieceType.BISHOP:
-            # Bishop: diagonal slide
-            ax_anim = ax + int((dx - ax) * ease * 0.8)
-            ay_anim = ay + int((dy - ay) * ease * 0.8)
-        elif attacker.piece_type == PieceType.QUEEN:
-            # Queen: fast dash
-            ax_anim = ax + int((dx - ax) * ease)
-            ay_anim = ay + int((dy - ay) * ease)
-        elif attacker.piece_type == PieceType.KING:
-            # King: slow, powerful move
-            ax_anim = ax + int((dx - ax) * ease * 0.5)
-            ay_anim = ay + int((dy - ay) * ease * 0.5)
-        else:
-            # Pawn: simple step
-            ax_anim = ax + int((dx - ax) * ease * 0.6)
-            ay_anim = ay + int((dy - ay) * ease * 0.6)
+        ease = COMBAT_EASE[frame]
+        reach, hops = ATTACK_MOTION.get(attacker.piece_type, (0.6, False))
+        ax_anim = ax + int((dx - ax) * ease * reach)
+        ay_anim = ay + int((dy - ay) * ease * reach)
+        if hops:
+            ay_anim += COMBAT_JUMP[frame]
 
         # Defender shake effect (stronger, more dynamic)
-        shake = int(10 * math.sin(progress * 12 * math.pi) * (1 - abs(0.5 - progress) * 2)) if progress > 0.6 else 0
+        shake = COMBAT_SHAKE[frame]
 
         # Draw attacker
-        sprite_a = self.piece_sprites.get(attacker.piece_type)
-        if sprite_a:
-            piece_size = self.board.cell_size - 10
-            scaled_sprite = pygame.transform.scale(sprite_a, (piece_size, piece_size))
-            if attacker.color == Color.BLACK:
-                tinted_sprite = scaled_sprite.copy()
-                dark_overlay = pygame.Surface((piece_size, piece_size))
-                dark_overlay.set_alpha(100)
-                dark_overlay.fill((100, 50, 50))
-                tinted_sprite.blit(dark_overlay, (0, 0))
-                scaled_sprite = tinted_sprite
-            screen.blit(scaled_sprite, (ax_anim + 5, ay_anim + 5))
-            border_color = (255, 255, 255) if attacker.color == Color.WHITE else (150, 50, 50)
-            pygame.draw.rect(screen, border_color, (ax_anim + 3, ay_anim + 3, piece_size + 4, piece_size + 4), 2)
+        board_sprite = self.get_board_sprite(attacker.piece_type, attacker.color)
+        if board_sprite:
+            screen.blit(board_sprite, (ax_anim + 3, ay_anim + 3))
         # Draw defender
-        sprite_d = self.piece_sprites.get(defender.piece_type)
-        if sprite_d:
-            piece_size = self.board.cell_size - 10
-            scaled_sprite = pygame.transform.scale(sprite_d, (piece_size, piece_size))
-            if defender.color == Color.BLACK:
-                tinted_sprite = scaled_sprite.copy()
-                dark_overlay = pygame.Surface((piece_size, piece_size))
-                dark_overlay.set_alpha(100)
-                dark_overlay.fill((100, 50, 50))
-                tinted_sprite.blit(dark_overlay, (0, 0))
-                scaled_sprite = tinted_sprite
-            screen.blit(scaled_sprite, (dx + 5 + shake, dy + 5))
-            border_color = (255, 255, 255) if defender.color == Color.WHITE else (150, 50, 50)
-            pygame.draw.rect(screen, border_color, (dx + 3 + shake, dy + 3, piece_size + 4, piece_size + 4), 2)
+        board_sprite = self.get_board_sprite(defender.piece_type, defender.color)
+        if board_sprite:
+            screen.blit(board_sprite, (dx + 3 + shake, dy + 3))